@@ -22,40 +22,337 @@ Without a PAT, you'll be limited to 60 API requests per hour and may not access
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 from datetime import datetime, timezone
 import argparse
 import sys
 import os
-from typing import Dict, List, Optional
+import itertools
+import logging
+import queue
+import shelve
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
+from dataclasses import dataclass
+from itertools import islice
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, List, Optional, Tuple, Union
+from urllib.parse import quote
+
+try:
+    import orjson  # Optional: much faster JSON parsing/serialization
+except ImportError:
+    orjson = None
+
+try:
+    from ciso8601 import parse_datetime as _parse_datetime  # Optional: C ISO 8601 parser
+except ImportError:
+    if sys.version_info >= (3, 11):
+        # fromisoformat accepts GitHub's trailing 'Z' natively
+        _parse_datetime = datetime.fromisoformat
+    else:
+        def _parse_datetime(value: str) -> datetime:
+            """Parse an ISO 8601 timestamp such as GitHub's '2025-01-01T00:00:00Z'"""
+            return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+logger = logging.getLogger(__name__)
+
+# Number of PR file lists fetched concurrently
+DEFAULT_MAX_WORKERS = 8
+
+# Pooled keep-alive connections to api.github.com
+POOL_MAXSIZE = 64
+
+# The Search API returns at most this many results per query
+SEARCH_RESULT_LIMIT = 1000
+
+# PRs matching a search query, with the first page of changed files for each
+PULL_REQUEST_FILES_QUERY = """
+query($q: String!, $after: String) {
+  search(query: $q, type: ISSUE, first: 50, after: $after) {
+    issueCount
+    pageInfo { endCursor hasNextPage }
+    nodes {
+      ... on PullRequest {
+        number title state isDraft createdAt updatedAt closedAt mergedAt url headRefOid
+        files(first: 100) {
+          pageInfo { hasNextPage }
+          nodes { path additions deletions changeType }
+        }
+      }
+    }
+  }
+}
+"""
+
+# GraphQL changeType -> REST file status
+GRAPHQL_FILE_STATUS = {
+    'ADDED': 'added',
+    'DELETED': 'removed',
+    'MODIFIED': 'modified',
+    'RENAMED': 'renamed',
+    'COPIED': 'copied',
+    'CHANGED': 'changed'
+}
+
+# Rate limit handling
+MAX_RETRIES = 5
+MAX_RETRY_WAIT = 300  # seconds; longer waits give up rather than stall the run
+RATE_LIMIT_THRESHOLD = 10  # pause until reset when fewer requests remain
+
+# On-disk ETag cache for PR file lists, reused across runs
+DEFAULT_CACHE_PATH = ".github_etag_cache"
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse a JSON response body, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> str:
+    """Serialize an object to a single line of JSON, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_PASSTHROUGH_DATACLASS).decode()
+    return json.dumps(obj, default=_json_default)
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize FileChange records; anything else unknown becomes a string"""
+    if isinstance(obj, FileChange):
+        return obj.to_dict()
+    return str(obj)
+
+
+@dataclass(slots=True)
+class FileChange:
+    """A file changed by a pull request"""
+    filename: str
+    status: str  # added, removed, modified, renamed
+    additions: int
+    deletions: int
+    changes: int
+    blob_url: Optional[str]
+    raw_url: Optional[str]
+    contents_url: Optional[str]
+    patch: Optional[str] = None  # Only when requested (can be large)
+    previous_filename: Optional[str] = None  # Only for renamed files
+    
+    def to_dict(self) -> Dict:
+        """Convert to a dict for JSON output, leaving out unset optional fields"""
+        data = {
+            'filename': self.filename,
+            'status': self.status,
+            'additions': self.additions,
+            'deletions': self.deletions,
+            'changes': self.changes,
+            'blob_url': self.blob_url,
+            'raw_url': self.raw_url,
+            'contents_url': self.contents_url
+        }
+        if self.patch is not None:
+            data['patch'] = self.patch
+        if self.previous_filename is not None:
+            data['previous_filename'] = self.previous_filename
+        return data
 
 
 class GitHubPRFileAnalyzer:
     """GitHub repository Pull Request file changes analyzer"""
     
-    def __init__(self, token: Optional[str] = None):
+    def __init__(self, token: Union[str, List[str], None] = None, max_workers: int = DEFAULT_MAX_WORKERS,
+                 cache_path: Optional[str] = DEFAULT_CACHE_PATH):
         """
         Initialize the GitHub PR file analyzer
         
         Args:
-            token: GitHub personal access token (required for reliable operation)
+            token: GitHub personal access token (required for reliable operation), or a
+                list of tokens to rotate through to get a rate limit per token
+            max_workers: Number of PR file lists to fetch concurrently
+            cache_path: ETag cache file for conditional requests (None to disable)
         """
-        self.token = token
+        self.tokens: List[str] = [token] if isinstance(token, str) else list(token or [])
+        # Requests rotate through the tokens; None stands for unauthenticated access
+        self._token_pool: List[Optional[str]] = self.tokens or [None]
+        self._token_cycle = itertools.cycle(self._token_pool)
+        # (token, resource) -> time that rate limit resets; core, search and graphql are separate budgets
+        self._token_reset: Dict[Tuple[Optional[str], str], float] = {}
+        self._token_lock = threading.Lock()
+        self.max_workers = max_workers
         self.base_url = "https://api.github.com"
+        self.graphql_url = "https://api.github.com/graphql"
         self.session = requests.Session()
         
-        if not self.token:
+        # Keep a warm connection for every worker and retry transient server errors
+        adapter = HTTPAdapter(
+            pool_maxsize=max(POOL_MAXSIZE, max_workers),
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.5,
+                status_forcelist=(500, 502, 503, 504),
+                respect_retry_after_header=True,
+                raise_on_status=False
+            )
+        )
+        self.session.mount("https://", adapter)
+        self.session.headers['Accept-Encoding'] = 'gzip'
+        
+        self._cache = shelve.open(cache_path) if cache_path else None
+        self._cache_lock = threading.Lock()
+        
+        if not self.tokens:
             print("⚠️  WARNING: No GitHub Personal Access Token provided!")
             print("   You'll be limited to 60 requests/hour and cannot access private repos.")
             print("   Get a PAT at: https://github.com/settings/tokens")
             print("   Use --token parameter or set GITHUB_TOKEN environment variable\n")
         
-        if self.token:
+        if self.tokens:
             self.session.headers.update({
-                'Authorization': f'token {self.token}',
                 'Accept': 'application/vnd.github.v3+json'
             })
     
+    def close(self):
+        """Flush and close the ETag cache"""
+        if self._cache is not None:
+            self._cache.close()
+            self._cache = None
+    
+    def _cache_get(self, key: str) -> Tuple[Optional[str], Any]:
+        """Return the cached (etag, body) for a key, or (None, None)"""
+        if self._cache is None:
+            return None, None
+        with self._cache_lock:
+            return self._cache.get(key, (None, None))
+    
+    def _cache_put(self, key: str, etag: Optional[str], body: Any):
+        """Store a response body under its ETag"""
+        if self._cache is None or not etag:
+            return
+        with self._cache_lock:
+            self._cache[key] = (etag, body)
+    
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send a GitHub API request, waiting out rate limits
+        
+        Each request uses the next token in rotation. Responses rejected by the
+        primary or secondary rate limit (403/429) are retried with another token
+        or after the delay GitHub asks for, backing off on each attempt. Any
+        other response is returned for the caller to handle.
+        
+        Args:
+            method: HTTP method
+            url: Request URL
+            **kwargs: Passed through to requests.Session.request
+            
+        Returns:
+            The final response
+        """
+        headers = kwargs.pop('headers', None) or {}
+        resource = self._rate_limit_resource(url)
+        
+        for attempt in range(1, MAX_RETRIES + 1):
+            token = self._next_token(resource)
+            request_headers = dict(headers)
+            if token:
+                request_headers['Authorization'] = f'token {token}'
+            
+            response = self.session.request(method, url, headers=request_headers, **kwargs)
+            self._track_rate_limit(token, resource, response)
+            if response.status_code not in (403, 429) or attempt == MAX_RETRIES:
+                break
+            
+            wait = self._rate_limit_wait(response, attempt, resource)
+            if wait is None:
+                break
+            logger.warning(f"  Rate limited ({response.status_code}), retrying in {wait:.0f}s (attempt {attempt}/{MAX_RETRIES})...")
+            time.sleep(wait)
+        
+        self._throttle(resource)
+        return response
+    
+    def _rate_limit_resource(self, url: str) -> str:
+        """Name of the rate limit budget a request URL draws from, as in X-RateLimit-Resource"""
+        if url.startswith(self.graphql_url):
+            return 'graphql'
+        if url.startswith(f"{self.base_url}/search/"):
+            return 'search'
+        return 'core'
+    
+    def _next_token(self, resource: str) -> Optional[str]:
+        """Pick the next token in rotation, skipping tokens whose rate limit for the resource is exhausted"""
+        with self._token_lock:
+            now = time.time()
+            for _ in range(len(self._token_pool)):
+                token = next(self._token_cycle)
+                if self._token_reset.get((token, resource), 0) <= now:
+                    return token
+            # Every token is exhausted; use the one that resets first
+            return min(self._token_pool, key=lambda t: self._token_reset[(t, resource)])
+    
+    def _track_rate_limit(self, token: Optional[str], resource: str, response: requests.Response):
+        """Mark a token's resource as exhausted until its reset time when only a few requests remain"""
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        reset = response.headers.get('X-RateLimit-Reset')
+        if remaining is None or reset is None:
+            return
+        # Small budgets (e.g. 10 searches a minute) would otherwise start out below the threshold
+        limit = int(response.headers.get('X-RateLimit-Limit', RATE_LIMIT_THRESHOLD * 10))
+        if int(remaining) >= min(RATE_LIMIT_THRESHOLD, limit // 10):
+            return
+        resource = response.headers.get('X-RateLimit-Resource', resource)
+        with self._token_lock:
+            self._token_reset[(token, resource)] = float(reset)
+    
+    def _seconds_until_token_available(self, resource: str) -> float:
+        """Seconds until some token has rate limit left for the resource (0 if one has now)"""
+        with self._token_lock:
+            reset = min(self._token_reset.get((t, resource), 0) for t in self._token_pool)
+        now = time.time()
+        return reset - now + 1 if reset > now else 0
+    
+    def _rate_limit_wait(self, response: requests.Response, attempt: int, resource: str) -> Optional[float]:
+        """
+        Work out how long to wait before retrying a 403/429 response
+        
+        Args:
+            response: The rejected response
+            attempt: Attempt number, starting at 1
+            resource: Rate limit budget the request draws from
+            
+        Returns:
+            Seconds to wait, or None if the response is not retryable
+        """
+        retry_after = response.headers.get('Retry-After')
+        if retry_after:
+            # Secondary rate limit
+            wait = float(retry_after) * attempt
+        elif response.headers.get('X-RateLimit-Remaining') == '0':
+            # Primary rate limit: retry right away with another token, or wait for a reset
+            wait = self._seconds_until_token_available(resource)
+        elif response.status_code == 429 or 'rate limit' in response.text.lower():
+            wait = 2 ** attempt
+        else:
+            # Plain access denied
+            return None
+        
+        if wait > MAX_RETRY_WAIT:
+            return None
+        return wait
+    
+    def _throttle(self, resource: str):
+        """Pause until a rate limit resets when every token is nearly exhausted for the resource"""
+        wait = self._seconds_until_token_available(resource)
+        if 0 < wait <= MAX_RETRY_WAIT:
+            logger.warning(f"  API rate limit nearly exhausted, waiting {wait:.0f}s for it to reset...")
+            time.sleep(wait)
+    
     def get_pull_requests(self, repo_owner: str, repo_name: str, author: str, since_date: str, state: str = "all", merged_only: bool = True, include_draft: bool = False) -> List[Dict]:
         """
         Get pull requests by a specific author since the given date
@@ -76,6 +373,10 @@ class GitHubPRFileAnalyzer:
         page = 1
         per_page = 100
         
+        # Loop-invariant values for the per-PR filter
+        since_datetime = _parse_datetime(since_date)
+        author_lc = author.lower()
+        
         while True:
             url = f"{self.base_url}/repos/{repo_owner}/{repo_name}/pulls"
             params = {
@@ -86,25 +387,25 @@ class GitHubPRFileAnalyzer:
                 'direction': 'desc'
             }
             
-            print(f"Fetching PRs page {page}...")
-            response = self.session.get(url, params=params)
+            logger.info(f"Fetching PRs page {page}...")
+            response = self._request('GET', url, params=params)
             
             if response.status_code == 404:
-                print(f"Error: Repository {repo_owner}/{repo_name} not found or not accessible")
+                logger.error(f"Error: Repository {repo_owner}/{repo_name} not found or not accessible")
                 return []
             elif response.status_code == 403:
                 error_msg = "Error: API rate limit exceeded or access forbidden"
-                if not self.token:
+                if not self.tokens:
                     error_msg += "\n💡 Try using a GitHub Personal Access Token with --token parameter"
                     error_msg += "\n   Get one at: https://github.com/settings/tokens"
-                print(error_msg)
+                logger.error(error_msg)
                 return []
             elif response.status_code != 200:
-                print(f"Error fetching PRs: {response.status_code} - {response.text}")
+                logger.error(f"Error fetching PRs: {response.status_code} - {response.text}")
                 return []
             
-            page_prs = response.json()
-            print(f"  Retrieved {len(page_prs)} PRs on page {page}")
+            page_prs = _json_loads(response.content)
+            logger.info(f"  Retrieved {len(page_prs)} PRs on page {page}")
             if not page_prs:
                 break
             
@@ -118,60 +419,233 @@ class GitHubPRFileAnalyzer:
                 pr_merged = pr.get('merged_at') is not None
                 
                 # Check if PR is by the specified author
-                if pr_author.lower() == author.lower():
-                    print(f"    PR #{pr_num} by {pr_author} - checking filters...")
+                if pr_author.lower() == author_lc:
+                    logger.info(f"    PR #{pr_num} by {pr_author} - checking filters...")
                     
                     # Check if PR was created after the specified date
-                    created_at = datetime.fromisoformat(pr['created_at'].replace('Z', '+00:00'))
-                    since_datetime = datetime.fromisoformat(since_date.replace('Z', '+00:00'))
+                    created_at = _parse_datetime(pr['created_at'])
                     
                     if created_at >= since_datetime:
-                        print(f"      ✓ Date OK: {pr['created_at']}")
+                        logger.info(f"      ✓ Date OK: {pr['created_at']}")
                         
                         # Filter by merged status if merged_only is True
                         if merged_only and not pr_merged:
-                            print(f"      ✗ Filtered out: Not merged (merged_only={merged_only})")
+                            logger.info(f"      ✗ Filtered out: Not merged (merged_only={merged_only})")
                             continue
                         else:
-                            print(f"      ✓ Merge status OK: merged={pr_merged}")
+                            logger.info(f"      ✓ Merge status OK: merged={pr_merged}")
                         
                         # Filter out draft PRs unless include_draft is True
                         if not include_draft and pr_draft:
-                            print(f"      ✗ Filtered out: Draft PR (include_draft={include_draft})")
+                            logger.info(f"      ✗ Filtered out: Draft PR (include_draft={include_draft})")
                             continue
                         else:
-                            print(f"      ✓ Draft status OK: draft={pr_draft}")
+                            logger.info(f"      ✓ Draft status OK: draft={pr_draft}")
                         
-                        print(f"      ✅ PR #{pr_num} ADDED to results")
+                        logger.info(f"      ✅ PR #{pr_num} ADDED to results")
                         filtered_prs.append(pr)
                     else:
-                        print(f"      ✗ Too old: {pr['created_at']} < {since_date}")
+                        logger.info(f"      ✗ Too old: {pr['created_at']} < {since_date}")
                         # Since PRs are sorted by creation date (desc), we can stop here
                         should_stop = True
                         break
             
-            print(f"  {len(filtered_prs)} PRs matched filters on page {page}")
+            logger.info(f"  {len(filtered_prs)} PRs matched filters on page {page}")
             pull_requests.extend(filtered_prs)
             
-            # Stop pagination if we hit old PRs
-            if should_stop:
+            # Stop pagination if we hit old PRs or GitHub reports no next page
+            if should_stop or 'next' not in response.links:
+                break
+            page += 1
+        
+        filter_text = self._describe_filters(merged_only, include_draft)
+        logger.info(f"Found {len(pull_requests)} {filter_text} PRs by {author} since {since_date}")
+        return pull_requests
+    
+    def search_pull_requests(self, repo_owner: str, repo_name: str, author: str, since_date: str, state: str = "all", merged_only: bool = True, include_draft: bool = False) -> Optional[List[Dict]]:
+        """
+        Get pull requests by a specific author since the given date using the Search API
+        
+        Unlike get_pull_requests, the filtering happens server-side, so only the
+        matching PRs are transferred instead of every PR in the repository.
+        
+        Args:
+            repo_owner: Repository owner username
+            repo_name: Repository name
+            author: Author username to filter PRs
+            since_date: ISO format date string (e.g., '2025-01-01T00:00:00Z')
+            state: PR state filter ('open', 'closed', 'all')
+            merged_only: Filter to only merged PRs (default: True)
+            include_draft: Include draft PRs (default: False)
+            
+        Returns:
+            List of pull request objects, or None if the search could not return
+            a complete result and get_pull_requests should be used instead
+        """
+        url = f"{self.base_url}/search/issues"
+        query = self._search_query(repo_owner, repo_name, author, since_date, state, merged_only, include_draft)
+        pull_requests = []
+        page = 1
+        per_page = 100
+        
+        while True:
+            params = {
+                'q': query,
+                'per_page': per_page,
+                'page': page,
+                'sort': 'created',
+                'order': 'desc'
+            }
+            
+            logger.info(f"Searching PRs page {page}...")
+            response = self._request('GET', url, params=params)
+            
+            if response.status_code != 200:
+                logger.warning(f"  Search unavailable ({response.status_code}), falling back to listing all PRs")
+                return None
+            
+            data = _json_loads(response.content)
+            if data.get('incomplete_results') or data['total_count'] > SEARCH_RESULT_LIMIT:
+                logger.warning(f"  Search cannot return all {data['total_count']} PRs, falling back to listing all PRs")
+                return None
+            
+            for item in data['items']:
+                # Search returns issue objects; the merge time lives under 'pull_request'
+                item['merged_at'] = item.get('pull_request', {}).get('merged_at')
+                pull_requests.append(item)
+            logger.info(f"  Retrieved {len(data['items'])} PRs on page {page}")
+            
+            if 'next' not in response.links:
                 break
             page += 1
+        
+        filter_text = self._describe_filters(merged_only, include_draft)
+        logger.info(f"Found {len(pull_requests)} {filter_text} PRs by {author} since {since_date}")
+        return pull_requests
+    
+    def get_pull_requests_with_files(self, repo_owner: str, repo_name: str, author: str, since_date: str, state: str = "all", merged_only: bool = True, include_draft: bool = False, limit: Optional[int] = None) -> Optional[List[Dict]]:
+        """
+        Get pull requests together with their changed files using the GraphQL API
+        
+        Each query returns up to 50 PRs with the first 100 files of each, replacing
+        one REST request per PR. GraphQL requires a token and does not expose
+        patches or previous filenames of renamed files.
+        
+        Args:
+            repo_owner: Repository owner username
+            repo_name: Repository name
+            author: Author username to filter PRs
+            since_date: ISO format date string (e.g., '2025-01-01T00:00:00Z')
+            state: PR state filter ('open', 'closed', 'all')
+            merged_only: Filter to only merged PRs (default: True)
+            include_draft: Include draft PRs (default: False)
+            limit: Stop once this many PRs have been fetched (None for all)
+            
+        Returns:
+            List of pull request objects with a 'files' list (None for PRs with more
+            than 100 files, which must be fetched via REST), or None if the query
+            failed and the REST endpoints should be used instead
+        """
+        query = self._search_query(repo_owner, repo_name, author, since_date, state, merged_only, include_draft)
+        variables = {'q': f"{query} sort:created-desc", 'after': None}
+        pull_requests = []
+        page = 1
+        
+        while True:
+            logger.info(f"Fetching PRs with files page {page} (GraphQL)...")
+            response = self._request('POST', self.graphql_url, json={'query': PULL_REQUEST_FILES_QUERY, 'variables': variables})
             
-            # GitHub API pagination limit check
-            if len(page_prs) < per_page:
+            data = _json_loads(response.content) if response.status_code == 200 else {}
+            if not data.get('data') or data.get('errors'):
+                logger.warning(f"  GraphQL query failed ({response.status_code}), falling back to the REST API")
+                return None
+            
+            search = data['data']['search']
+            if search['issueCount'] > SEARCH_RESULT_LIMIT:
+                logger.warning(f"  Search cannot return all {search['issueCount']} PRs, falling back to the REST API")
+                return None
+            
+            for node in search['nodes']:
+                pull_requests.append(self._graphql_pull_request(node))
+            logger.info(f"  Retrieved {len(search['nodes'])} PRs on page {page}")
+            
+            if not search['pageInfo']['hasNextPage'] or (limit and len(pull_requests) >= limit):
                 break
+            variables['after'] = search['pageInfo']['endCursor']
+            page += 1
+        
+        filter_text = self._describe_filters(merged_only, include_draft)
+        logger.info(f"Found {len(pull_requests)} {filter_text} PRs by {author} since {since_date}")
+        return pull_requests
+    
+    def _graphql_pull_request(self, node: Dict) -> Dict:
+        """Convert a GraphQL PullRequest node to the REST pull request shape"""
+        # Links to file contents at the PR head, as the REST files endpoint returns them
+        repo_url = node['url'].rsplit('/pull/', 1)[0]
+        api_repo_url = f"{self.base_url}/repos/{repo_url.split('/', 3)[3]}"
+        head_sha = node['headRefOid']
+        
+        files = None
+        if node['files'] is not None and not node['files']['pageInfo']['hasNextPage']:
+            files = []
+            for file in node['files']['nodes']:
+                path = quote(file['path'])
+                files.append(FileChange(
+                    filename=file['path'],
+                    status=GRAPHQL_FILE_STATUS.get(file['changeType'], file['changeType'].lower()),
+                    additions=file['additions'],
+                    deletions=file['deletions'],
+                    changes=file['additions'] + file['deletions'],
+                    blob_url=f"{repo_url}/blob/{head_sha}/{path}",
+                    raw_url=f"{repo_url}/raw/{head_sha}/{path}",
+                    contents_url=f"{api_repo_url}/contents/{path}?ref={head_sha}"
+                ))
         
+        return {
+            'number': node['number'],
+            'title': node['title'],
+            'state': 'open' if node['state'] == 'OPEN' else 'closed',
+            'draft': node['isDraft'],
+            'created_at': node['createdAt'],
+            'updated_at': node['updatedAt'],
+            'closed_at': node['closedAt'],
+            'merged_at': node['mergedAt'],
+            'html_url': node['url'],
+            'files': files
+        }
+    
+    def _search_query(self, repo_owner: str, repo_name: str, author: str, since_date: str, state: str, merged_only: bool, include_draft: bool) -> str:
+        """Build a GitHub search query matching the PR filters"""
+        qualifiers = [
+            f"repo:{repo_owner}/{repo_name}",
+            "is:pr",
+            f"author:{author}",
+            f"created:>={since_date}"
+        ]
+        if state != 'all':
+            qualifiers.append(f"is:{state}")
+        if merged_only:
+            qualifiers.append("is:merged")
+        if not include_draft:
+            qualifiers.append("draft:false")
+        return " ".join(qualifiers)
+    
+    def _describe_filters(self, merged_only: bool, include_draft: bool) -> str:
+        """Describe the merge/draft filters for log messages"""
         filter_desc = []
         if merged_only:
             filter_desc.append("merged")
         if not include_draft:
             filter_desc.append("non-draft")
-        filter_text = " ".join(filter_desc) if filter_desc else "all"
-        print(f"Found {len(pull_requests)} {filter_text} PRs by {author} since {since_date}")
-        return pull_requests
+        return " ".join(filter_desc) if filter_desc else "all"
+    
+    def _get_files_for_pr(self, repo_owner: str, repo_name: str, pr: Dict, include_patch: bool) -> List[FileChange]:
+        """Return the files already fetched with the PR via GraphQL, or fetch them via REST"""
+        if pr.get('files') is not None:
+            return pr['files']
+        return self.get_pr_files(repo_owner, repo_name, pr['number'], include_patch)
     
-    def get_pr_files(self, repo_owner: str, repo_name: str, pr_number: int, include_patch: bool = False) -> List[Dict]:
+    def get_pr_files(self, repo_owner: str, repo_name: str, pr_number: int, include_patch: bool = False) -> List[FileChange]:
         """
         Get list of files changed in a specific pull request
         
@@ -182,7 +656,7 @@ class GitHubPRFileAnalyzer:
             include_patch: Whether to include patch/diff content
             
         Returns:
-            List of file change objects
+            List of FileChange records
         """
         url = f"{self.base_url}/repos/{repo_owner}/{repo_name}/pulls/{pr_number}/files"
         files = []
@@ -195,50 +669,48 @@ class GitHubPRFileAnalyzer:
                 'page': page
             }
             
-            response = self.session.get(url, params=params)
+            # Files of a PR rarely change once merged; a 304 costs no rate limit
+            cache_key = f"{repo_owner}/{repo_name}/pulls/{pr_number}/files?page={page}"
+            etag, cached_page = self._cache_get(cache_key)
+            headers = {'If-None-Match': etag} if etag else None
             
-            if response.status_code != 200:
-                print(f"Warning: Could not fetch files for PR #{pr_number}: {response.status_code}")
-                return []
+            response = self._request('GET', url, params=params, headers=headers)
             
-            page_files = response.json()
-            if not page_files:
-                break
+            if response.status_code == 304:
+                page_files, has_next = cached_page
+            elif response.status_code != 200:
+                logger.warning(f"Warning: Could not fetch files for PR #{pr_number}: {response.status_code}")
+                return []
+            else:
+                page_files = _json_loads(response.content)
+                has_next = 'next' in response.links
+                self._cache_put(cache_key, response.headers.get('ETag'), (page_files, has_next))
             
             for file in page_files:
-                file_info = {
-                    'filename': file['filename'],
-                    'status': file['status'],  # added, removed, modified, renamed
-                    'additions': file['additions'],
-                    'deletions': file['deletions'],
-                    'changes': file['changes'],
-                    'blob_url': file.get('blob_url'),
-                    'raw_url': file.get('raw_url'),
-                    'contents_url': file.get('contents_url')
-                }
-                
-                # Include patch if requested (can be large)
-                if include_patch and 'patch' in file:
-                    file_info['patch'] = file['patch']
-                
-                # Include previous filename if renamed
-                if file['status'] == 'renamed' and 'previous_filename' in file:
-                    file_info['previous_filename'] = file['previous_filename']
-                
-                files.append(file_info)
+                files.append(FileChange(
+                    filename=file['filename'],
+                    status=file['status'],
+                    additions=file['additions'],
+                    deletions=file['deletions'],
+                    changes=file['changes'],
+                    blob_url=file.get('blob_url'),
+                    raw_url=file.get('raw_url'),
+                    contents_url=file.get('contents_url'),
+                    patch=file.get('patch') if include_patch else None,
+                    previous_filename=file.get('previous_filename') if file['status'] == 'renamed' else None
+                ))
             
+            # The Link header is authoritative. Most PRs touch fewer than 100 files,
+            # so this usually returns after the first request.
+            if not has_next:
+                return files
             page += 1
-            
-            # GitHub API pagination limit check
-            if len(page_files) < per_page:
-                break
-        
-        return files
     
     def analyze_pr_file_changes(self, repo_owner: str, repo_name: str, author: str, 
                                 start_date: str = "2025-01-01", state: str = "all",
                                 include_patch: bool = False, limit: Optional[int] = None,
-                                merged_only: bool = True, include_draft: bool = False) -> Dict:
+                                merged_only: bool = True, include_draft: bool = False,
+                                output: Optional[str] = None) -> Dict:
         """
         Analyze file changes for Pull Requests in a repository
         
@@ -252,6 +724,7 @@ class GitHubPRFileAnalyzer:
             limit: Limit number of PRs to analyze (None for all)
             merged_only: Filter to only merged PRs (default: True)
             include_draft: Include draft PRs (default: False)
+            output: JSON Lines file to stream results to (one line per PR, summary last)
             
         Returns:
             Dictionary containing PR file change statistics
@@ -262,110 +735,125 @@ class GitHubPRFileAnalyzer:
             start_datetime = start_datetime.replace(tzinfo=timezone.utc)
             since_date = start_datetime.isoformat()
         except ValueError:
-            print(f"Error: Invalid date format '{start_date}'. Please use YYYY-MM-DD format.")
+            logger.error(f"Error: Invalid date format '{start_date}'. Please use YYYY-MM-DD format.")
             return {}
         
-        print(f"\nAnalyzing Pull Request file changes for repository: {repo_owner}/{repo_name}")
-        print(f"Author: {author}")
-        print(f"Start date: {start_date}")
-        print(f"State filter: {state}")
-        print(f"Merged only: {merged_only}")
-        print(f"Include draft: {include_draft}")
-        print(f"Include patches: {include_patch}")
+        logger.info(f"\nAnalyzing Pull Request file changes for repository: {repo_owner}/{repo_name}")
+        logger.info(f"Author: {author}")
+        logger.info(f"Start date: {start_date}")
+        logger.info(f"State filter: {state}")
+        logger.info(f"Merged only: {merged_only}")
+        logger.info(f"Include draft: {include_draft}")
+        logger.info(f"Include patches: {include_patch}")
         if limit:
-            print(f"PR limit: {limit}")
-        print("-" * 70)
+            logger.info(f"PR limit: {limit}")
+        logger.info("-" * 70)
         
-        # Get pull requests
-        prs = self.get_pull_requests(repo_owner, repo_name, author, since_date, state, merged_only, include_draft)
-        
-        if not prs:
-            return {
-                'repository': f"{repo_owner}/{repo_name}",
-                'author': author,
-                'start_date': start_date,
-                'state_filter': state,
-                'merged_only': merged_only,
-                'include_draft': include_draft,
-                'total_prs': 0,
-                'total_files_changed': 0,
-                'total_additions': 0,
-                'total_deletions': 0,
-                'file_extension_stats': {},
-                'pull_requests': []
-            }
+        # Get pull requests, preferring GraphQL (PRs and files together), then the
+        # Search API (server-side filtering), then listing every PR in the repository
+        prs = None
+        if self.tokens and not include_patch:
+            prs = self.get_pull_requests_with_files(repo_owner, repo_name, author, since_date, state, merged_only, include_draft, limit)
+        if prs is None:
+            prs = self.search_pull_requests(repo_owner, repo_name, author, since_date, state, merged_only, include_draft)
+        if prs is None:
+            prs = self.get_pull_requests(repo_owner, repo_name, author, since_date, state, merged_only, include_draft)
         
         # Limit PRs if specified
         if limit:
             prs = prs[:limit]
-            print(f"Limiting analysis to {len(prs)} most recent PRs")
+            logger.info(f"Limiting analysis to {len(prs)} most recent PRs")
         
-        pr_file_details = []
+        pr_file_details: List[Optional[Dict]] = [None] * len(prs)
         total_files_changed = 0
         total_additions = 0
         total_deletions = 0
-        file_extension_stats = {}
+        file_ext_count = Counter()
+        file_ext_additions = Counter()
+        file_ext_deletions = Counter()
+        # The same files tend to be touched by many PRs; split each name only once
+        ext_cache: Dict[str, str] = {}
         
-        print(f"\nProcessing {len(prs)} pull requests...")
+        logger.info(f"\nProcessing {len(prs)} pull requests...")
         
-        for i, pr in enumerate(prs, 1):
-            print(f"\nProcessing PR {i}/{len(prs)}: #{pr['number']} - {pr['title'][:50]}...")
-            
-            # Get files changed in this PR
-            files = self.get_pr_files(repo_owner, repo_name, pr['number'], include_patch)
-            
-            # Initialize counters (in case files is empty)
-            pr_additions = 0
-            pr_deletions = 0
+        # Fetch file lists concurrently; each PR is an independent, network-bound request.
+        # Worker threads only fetch: this thread handles each PR as soon as its files
+        # arrive and is the single writer of the output file, so partial results
+        # survive an interrupted run. Output lines follow completion order, while
+        # pr_file_details keeps the listing's newest-first order.
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor, \
+                (open(output, 'w', encoding='utf-8') if output else nullcontext()) as out:
+            futures = {
+                executor.submit(self._get_files_for_pr, repo_owner, repo_name, pr, include_patch): index
+                for index, pr in enumerate(prs)
+            }
             
-            if files:
-                print(f"  Found {len(files)} files changed")
-                total_files_changed += len(files)
+            for i, future in enumerate(as_completed(futures), 1):
+                index = futures[future]
+                pr = prs[index]
+                files = future.result()
+                logger.info(f"\nProcessed PR {i}/{len(prs)}: #{pr['number']} - {pr['title'][:50]}...")
                 
-                pr_additions = sum(f['additions'] for f in files)
-                pr_deletions = sum(f['deletions'] for f in files)
-                total_additions += pr_additions
-                total_deletions += pr_deletions
+                # Initialize counters (in case files is empty)
+                pr_additions = 0
+                pr_deletions = 0
                 
-                # Track file extensions
-                for file in files:
-                    ext = os.path.splitext(file['filename'])[1] or 'no_extension'
-                    if ext not in file_extension_stats:
-                        file_extension_stats[ext] = {
-                            'count': 0,
-                            'additions': 0,
-                            'deletions': 0
-                        }
-                    file_extension_stats[ext]['count'] += 1
-                    file_extension_stats[ext]['additions'] += file['additions']
-                    file_extension_stats[ext]['deletions'] += file['deletions']
-            
-            # Extract PR information with file details
-            pr_info = {
-                'number': pr['number'],
-                'title': pr['title'],
-                'state': pr['state'],
-                'draft': pr.get('draft', False),
-                'created_at': pr['created_at'],
-                'updated_at': pr['updated_at'],
-                'closed_at': pr.get('closed_at'),
-                'merged_at': pr.get('merged_at'),
-                'html_url': pr['html_url'],
-                'total_files_changed': len(files),
-                'total_additions': pr_additions,
-                'total_deletions': pr_deletions,
-                'files': files
-            }
+                if files:
+                    logger.info(f"  Found {len(files)} files changed")
+                    total_files_changed += len(files)
+                    
+                    # PR totals and file extension stats in a single pass over the files
+                    for file in files:
+                        additions = file.additions
+                        deletions = file.deletions
+                        pr_additions += additions
+                        pr_deletions += deletions
+                        
+                        filename = file.filename
+                        ext = ext_cache.get(filename)
+                        if ext is None:
+                            ext = ext_cache[filename] = os.path.splitext(filename)[1] or 'no_extension'
+                        file_ext_count[ext] += 1
+                        file_ext_additions[ext] += additions
+                        file_ext_deletions[ext] += deletions
+                    
+                    total_additions += pr_additions
+                    total_deletions += pr_deletions
+                
+                # Extract PR information with file details
+                pr_info = {
+                    'number': pr['number'],
+                    'title': pr['title'],
+                    'state': pr['state'],
+                    'draft': pr.get('draft', False),
+                    'created_at': pr['created_at'],
+                    'updated_at': pr['updated_at'],
+                    'closed_at': pr.get('closed_at'),
+                    'merged_at': pr.get('merged_at'),
+                    'html_url': pr['html_url'],
+                    'total_files_changed': len(files),
+                    'total_additions': pr_additions,
+                    'total_deletions': pr_deletions,
+                    'files': files
+                }
+                
+                if out:
+                    out.write(_json_dumps(pr_info) + "\n")
+                    # Patches only matter in the output file; don't hold them in memory
+                    for file in files:
+                        file.patch = None
+                
+                pr_file_details[index] = pr_info
             
-            pr_file_details.append(pr_info)
-        
-        # Sort PRs by number (descending)
-        pr_file_details.sort(key=lambda x: x['number'], reverse=True)
-        
-        # Sort file extension stats by count
-        sorted_ext_stats = dict(sorted(file_extension_stats.items(), 
-                                      key=lambda x: x[1]['count'], 
-                                      reverse=True))
+        # Merge the extension counters, sorted by count
+        sorted_ext_stats = {
+            ext: {
+                'count': count,
+                'additions': file_ext_additions[ext],
+                'deletions': file_ext_deletions[ext]
+            }
+            for ext, count in file_ext_count.most_common()
+        }
         
         results = {
             'repository': f"{repo_owner}/{repo_name}",
@@ -382,6 +870,12 @@ class GitHubPRFileAnalyzer:
             'pull_requests': pr_file_details
         }
         
+        if output:
+            # Summary goes last, after every PR line
+            summary = {key: value for key, value in results.items() if key != 'pull_requests'}
+            with open(output, 'a', encoding='utf-8') as out:
+                out.write(_json_dumps(summary) + "\n")
+        
         return results
     
     def print_summary(self, results: Dict):
@@ -411,7 +905,7 @@ class GitHubPRFileAnalyzer:
             print("\nFile Type Statistics (Top 10):")
             print(f"{'Extension':<15} {'Files':<10} {'Added':<12} {'Deleted':<12} {'Net':<12}")
             print("-" * 70)
-            for ext, stats in list(results['file_extension_stats'].items())[:10]:
+            for ext, stats in islice(results['file_extension_stats'].items(), 10):
                 net_change = stats['additions'] - stats['deletions']
                 print(f"{ext:<15} {stats['count']:<10} {stats['additions']:<12,} {stats['deletions']:<12,} {net_change:+<12,}")
         
@@ -431,19 +925,40 @@ class GitHubPRFileAnalyzer:
             
             if pr['files']:
                 print(f"   Changed files:")
-                for file in pr['files'][:20]:  # Limit to first 20 files per PR
+                for file in islice(pr['files'], 20):  # Limit to first 20 files per PR
                     status_icon = {
                         'added': '➕',
                         'removed': '➖',
                         'modified': '📝',
                         'renamed': '🔄'
-                    }.get(file['status'], '❓')
+                    }.get(file.status, '❓')
                     
-                    change_text = f"+{file['additions']} -{file['deletions']}"
-                    print(f"      {status_icon} {file['filename']} ({change_text})")
+                    change_text = f"+{file.additions} -{file.deletions}"
+                    print(f"      {status_icon} {file.filename} ({change_text})")
                 
-                if len(pr['files']) > 20:
-                    print(f"      ... and {len(pr['files']) - 20} more files")
+                extra_files = len(pr['files']) - 20
+                if extra_files > 0:
+                    print(f"      ... and {extra_files} more files")
+
+
+def _start_logging() -> QueueListener:
+    """
+    Route progress logging through a queue to a background thread
+    
+    Worker threads only enqueue records, so they never block on a slow or
+    piped stdout.
+    
+    Returns:
+        The running listener; stop it to flush pending messages
+    """
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    log_queue = queue.Queue(-1)
+    logger.addHandler(QueueHandler(log_queue))
+    logger.setLevel(logging.INFO)
+    listener = QueueListener(log_queue, handler)
+    listener.start()
+    return listener
 
 
 def main():
@@ -458,6 +973,8 @@ GitHub Personal Access Token Required:
   Usage options:
   1. Command line: --token YOUR_TOKEN_HERE
   2. Environment: export GITHUB_TOKEN=YOUR_TOKEN_HERE
+  3. Several tokens, used in rotation: --token TOKEN_A --token TOKEN_B
+     or export GITHUB_TOKENS=TOKEN_A,TOKEN_B
   
   Without a token, you're limited to 60 requests/hour.''',
         formatter_class=argparse.RawDescriptionHelpFormatter
@@ -469,9 +986,11 @@ GitHub Personal Access Token Required:
                       help='Start date in YYYY-MM-DD format (default: 2025-01-01)')
     parser.add_argument('--state', choices=['open', 'closed', 'all'], default='all',
                       help='Filter PRs by state (default: all)')
-    parser.add_argument('--token', 
-                      help='GitHub Personal Access Token (or set GITHUB_TOKEN env var)')
-    parser.add_argument('--output', help='Output file path to save results as JSON')
+    parser.add_argument('--token', action='append',
+                      help='GitHub Personal Access Token (or set GITHUB_TOKEN env var); '
+                           'repeat to rotate through several tokens')
+    parser.add_argument('--output',
+                      help='Output file path to stream results as JSON Lines (one line per PR, summary last)')
     parser.add_argument('--include-patch', action='store_true',
                       help='Include diff/patch content in output (makes output much larger)')
     parser.add_argument('--limit', type=int,
@@ -480,36 +999,53 @@ GitHub Personal Access Token Required:
                       help='Include draft PRs in analysis (default: exclude drafts)')
     parser.add_argument('--all-prs', action='store_true',
                       help='Include all PRs regardless of merge status (default: merged only)')
+    parser.add_argument('--cache-file', default=DEFAULT_CACHE_PATH,
+                      help=f'ETag cache file used to skip unchanged PR file lists (default: {DEFAULT_CACHE_PATH})')
+    parser.add_argument('--no-cache', action='store_true',
+                      help='Disable the ETag cache')
+    parser.add_argument('--workers', type=int, default=DEFAULT_MAX_WORKERS,
+                      help=f'Number of PRs to fetch files for concurrently (default: {DEFAULT_MAX_WORKERS})')
     
     args = parser.parse_args()
     
-    # Get token from args or environment
-    token = args.token or os.getenv('GITHUB_TOKEN')
+    # Get tokens from args or environment
+    tokens = args.token or [t.strip() for t in os.getenv('GITHUB_TOKENS', '').split(',') if t.strip()]
+    if not tokens and os.getenv('GITHUB_TOKEN'):
+        tokens = [os.getenv('GITHUB_TOKEN')]
     
     # Initialize analyzer
-    analyzer = GitHubPRFileAnalyzer(token=token)
-    
-    # Analyze repository
-    results = analyzer.analyze_pr_file_changes(
-        repo_owner=args.repo_owner,
-        repo_name=args.repo_name,
-        author=args.author,
-        start_date=args.start_date,
-        state=args.state,
-        include_patch=args.include_patch,
-        limit=args.limit,
-        merged_only=not args.all_prs,
-        include_draft=args.get_draft
+    analyzer = GitHubPRFileAnalyzer(
+        token=tokens,
+        max_workers=args.workers,
+        cache_path=None if args.no_cache else args.cache_file
     )
     
+    # Analyze repository; progress is logged from a background thread
+    listener = _start_logging()
+    try:
+        results = analyzer.analyze_pr_file_changes(
+            repo_owner=args.repo_owner,
+            repo_name=args.repo_name,
+            author=args.author,
+            start_date=args.start_date,
+            state=args.state,
+            include_patch=args.include_patch,
+            limit=args.limit,
+            merged_only=not args.all_prs,
+            include_draft=args.get_draft,
+            output=args.output
+        )
+    finally:
+        analyzer.close()
+        # Flush pending progress messages before the summary is printed
+        listener.stop()
+    
     if results:
         # Print summary
         analyzer.print_summary(results)
         
-        # Save to file if specified
+        # Results were streamed to the output file during analysis
         if args.output:
-            with open(args.output, 'w') as f:
-                json.dump(results, f, indent=2, default=str)
             print(f"\n{'=' * 70}")
             print(f"✅ Detailed results saved to: {args.output}")
     else:
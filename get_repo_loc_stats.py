@@ -20,41 +20,314 @@ Without a PAT, you'll be limited to 60 API requests per hour and may not access
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 from datetime import datetime, timezone
 import argparse
+import heapq
 import sys
+import time
+import itertools
+import logging
 import os
-from typing import Dict, List, Optional, Tuple
+import queue
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, is_dataclass
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+try:
+    import orjson  # Optional: much faster JSON parsing/serialization
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Number of commits whose stats are fetched concurrently
+DEFAULT_MAX_WORKERS = 8
+
+# Pooled keep-alive connections to api.github.com
+POOL_MAXSIZE = 50
+
+# Commits processed between progress messages
+PROGRESS_INTERVAL = 50
+
+# Rate-limited requests are tried this many times; longer waits give up rather than stall the run
+MAX_RETRIES = 5
+MAX_RETRY_WAIT = 300
+
+# A token is set aside until its rate limit resets once fewer requests than this remain
+RATE_LIMIT_THRESHOLD = 10
+
+# On-disk commit stats and commit list page cache for the REST API, reused across runs
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "get-repo-loc-stats", "cache.db")
+
+# GraphQL node ID of a user, needed to filter commit history by author
+USER_ID_QUERY = """
+query($login: String!) {
+  user(login: $login) { id }
+}
+"""
+
+# Default branch history with per-commit stats, 100 commits per page
+COMMIT_HISTORY_QUERY = """
+query($owner: String!, $name: String!, $authorId: ID!, $since: GitTimestamp!, $until: GitTimestamp, $after: String) {
+  repository(owner: $owner, name: $name) {
+    defaultBranchRef {
+      target {
+        ... on Commit {
+          history(first: 100, after: $after, since: $since, until: $until, author: {id: $authorId}) {
+            pageInfo { endCursor hasNextPage }
+            nodes { oid message authoredDate additions deletions }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse a JSON response body, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> str:
+    """Serialize results as indented JSON, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2, default=_json_default)
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize CommitStat records; anything else unknown becomes a string"""
+    if is_dataclass(obj):
+        return asdict(obj)
+    return str(obj)
+
+
+@dataclass(slots=True)
+class CommitStat:
+    """Lines changed by a single commit"""
+    sha: str
+    message: str  # First line only
+    date: str
+    additions: int
+    deletions: int
+    total_changes: int
 
 
 class GitHubLOCAnalyzer:
     """GitHub repository LOC analyzer"""
     
-    def __init__(self, token: Optional[str] = None):
+    def __init__(self, token: Union[str, List[str], None] = None, max_workers: int = DEFAULT_MAX_WORKERS,
+                 cache_path: Optional[str] = DEFAULT_CACHE_PATH):
         """
         Initialize the GitHub LOC analyzer
         
         Args:
-            token: GitHub personal access token (required for reliable operation)
+            token: GitHub personal access token (required for reliable operation), or a
+                list of tokens to rotate through to get a rate limit per token
+            max_workers: Number of commits to fetch stats for concurrently
+            cache_path: SQLite file caching REST commit stats by SHA (None to disable)
         """
-        self.token = token
+        self.tokens: List[str] = [token] if isinstance(token, str) else list(token or [])
+        # Requests rotate through the tokens; None stands for unauthenticated access
+        self._token_pool: List[Optional[str]] = self.tokens or [None]
+        self._token_cycle = itertools.cycle(self._token_pool)
+        # (token, resource) -> time that rate limit resets; core and graphql are separate budgets
+        self._token_reset: Dict[Tuple[Optional[str], str], float] = {}
+        self._token_lock = threading.Lock()
+        self.max_workers = max_workers
         self.base_url = "https://api.github.com"
+        self.graphql_url = "https://api.github.com/graphql"
         self.session = requests.Session()
         
-        if not self.token:
+        # Reuse warm TLS connections across requests and retry transient server errors.
+        # GraphQL queries are read-only, so their POSTs are as safe to retry as GETs.
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=max(POOL_MAXSIZE, max_workers),
+            max_retries=Retry(
+                total=5,
+                backoff_factor=1.0,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {'POST'},
+                respect_retry_after_header=True,
+                raise_on_status=False
+            )
+        )
+        self.session.mount("https://", adapter)
+        
+        # Commit stats never change for a given SHA, so cached entries need no invalidation.
+        # Commit list pages are revalidated with their ETag instead.
+        self._cache = None
+        self._cache_lock = threading.Lock()
+        if cache_path:
+            os.makedirs(os.path.dirname(cache_path) or ".", exist_ok=True)
+            self._cache = sqlite3.connect(cache_path, check_same_thread=False)
+            self._cache.execute(
+                "CREATE TABLE IF NOT EXISTS commit_stats (sha TEXT PRIMARY KEY, additions INT, deletions INT)"
+            )
+            self._cache.execute(
+                "CREATE TABLE IF NOT EXISTS etag_cache (url TEXT PRIMARY KEY, etag TEXT, body BLOB)"
+            )
+        
+        if not self.tokens:
             print("⚠️  WARNING: No GitHub Personal Access Token provided!")
             print("   You'll be limited to 60 requests/hour and cannot access private repos.")
             print("   Get a PAT at: https://github.com/settings/tokens")
             print("   Use --token parameter or set GITHUB_TOKEN environment variable\n")
         
-        if self.token:
+        if self.tokens:
             self.session.headers.update({
-                'Authorization': f'token {self.token}',
                 'Accept': 'application/vnd.github.v3+json'
             })
     
-    def get_commits(self, repo_owner: str, repo_name: str, author: str, since_date: str) -> List[Dict]:
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send a GitHub API request, waiting out rate limits
+        
+        Each request uses the next token in rotation, skipping tokens whose rate
+        limit is exhausted. Responses rejected by the primary or secondary rate
+        limit (403/429) are retried with another token or after the delay GitHub
+        asks for, backing off on each attempt. Any other response is returned
+        for the caller to handle.
+        
+        Args:
+            method: HTTP method
+            url: Request URL
+            **kwargs: Passed through to requests.Session.request
+            
+        Returns:
+            The final response
+        """
+        headers = kwargs.pop('headers', None) or {}
+        resource = self._rate_limit_resource(url)
+        
+        for attempt in range(1, MAX_RETRIES + 1):
+            token = self._next_token(resource)
+            request_headers = dict(headers)
+            if token:
+                request_headers['Authorization'] = f'token {token}'
+            
+            response = self.session.request(method, url, headers=request_headers, **kwargs)
+            self._track_rate_limit(token, resource, response)
+            if response.status_code not in (403, 429) or attempt == MAX_RETRIES:
+                break
+            
+            wait = self._rate_limit_wait(response, attempt, resource)
+            if wait is None:
+                break
+            logger.warning(f"Rate limited ({response.status_code}), retrying in {wait:.0f}s (attempt {attempt}/{MAX_RETRIES})...")
+            time.sleep(wait)
+        
+        self._throttle(resource)
+        return response
+    
+    def _rate_limit_resource(self, url: str) -> str:
+        """Name of the rate limit budget a request URL draws from, as in X-RateLimit-Resource"""
+        return 'graphql' if url.startswith(self.graphql_url) else 'core'
+    
+    def _next_token(self, resource: str) -> Optional[str]:
+        """Pick the next token in rotation, skipping tokens whose rate limit for the resource is exhausted"""
+        with self._token_lock:
+            now = time.time()
+            for _ in range(len(self._token_pool)):
+                token = next(self._token_cycle)
+                if self._token_reset.get((token, resource), 0) <= now:
+                    return token
+            # Every token is exhausted; use the one that resets first
+            return min(self._token_pool, key=lambda t: self._token_reset[(t, resource)])
+    
+    def _track_rate_limit(self, token: Optional[str], resource: str, response: requests.Response):
+        """Mark a token's resource as exhausted until its reset time when only a few requests remain"""
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        reset = response.headers.get('X-RateLimit-Reset')
+        if remaining is None or reset is None:
+            return
+        limit = int(response.headers.get('X-RateLimit-Limit', RATE_LIMIT_THRESHOLD * 10))
+        if int(remaining) >= min(RATE_LIMIT_THRESHOLD, limit // 10):
+            return
+        resource = response.headers.get('X-RateLimit-Resource', resource)
+        with self._token_lock:
+            self._token_reset[(token, resource)] = float(reset)
+    
+    def _seconds_until_token_available(self, resource: str) -> float:
+        """Seconds until some token has rate limit left for the resource (0 if one has now)"""
+        with self._token_lock:
+            reset = min(self._token_reset.get((t, resource), 0) for t in self._token_pool)
+        now = time.time()
+        return reset - now + 1 if reset > now else 0
+    
+    def close(self):
+        """Commit and close the cache"""
+        if self._cache is not None:
+            self._cache.commit()
+            self._cache.close()
+            self._cache = None
+    
+    def _cached_page(self, url: str) -> Tuple[Optional[str], Optional[bytes]]:
+        """Return the cached (etag, body) for a page URL, or (None, None)"""
+        if self._cache is None:
+            return None, None
+        with self._cache_lock:
+            cached = self._cache.execute("SELECT etag, body FROM etag_cache WHERE url = ?", (url,)).fetchone()
+        return cached or (None, None)
+    
+    def _cache_page(self, url: str, etag: Optional[str], body: bytes):
+        """Store a page body under its ETag for later conditional requests"""
+        if self._cache is None or not etag:
+            return
+        with self._cache_lock:
+            self._cache.execute(
+                "INSERT OR REPLACE INTO etag_cache (url, etag, body) VALUES (?, ?, ?)", (url, etag, body)
+            )
+    
+    def _rate_limit_wait(self, response: requests.Response, attempt: int, resource: str) -> Optional[float]:
+        """
+        Work out how long to wait before retrying a 403/429 response
+        
+        Args:
+            response: The rejected response
+            attempt: Attempt number, starting at 1
+            resource: Rate limit budget the request draws from
+            
+        Returns:
+            Seconds to wait, or None if the response is not retryable or the
+            wait is longer than MAX_RETRY_WAIT
+        """
+        retry_after = response.headers.get('Retry-After')
+        if retry_after:
+            # Secondary rate limit
+            wait = float(retry_after) * attempt
+        elif response.headers.get('X-RateLimit-Remaining') == '0':
+            # Primary rate limit: retry right away with another token, or wait for a reset
+            wait = self._seconds_until_token_available(resource)
+        elif response.status_code == 429 or 'rate limit' in response.text.lower():
+            wait = 2 ** attempt
+        else:
+            # Plain access denied
+            return None
+        
+        return wait if wait <= MAX_RETRY_WAIT else None
+    
+    def _throttle(self, resource: str):
+        """Pause until a rate limit resets when every token is nearly exhausted for the resource"""
+        wait = self._seconds_until_token_available(resource)
+        if 0 < wait <= MAX_RETRY_WAIT:
+            logger.warning(f"API rate limit nearly exhausted, waiting {wait:.0f}s for it to reset...")
+            time.sleep(wait)
+    
+    def get_commits(self, repo_owner: str, repo_name: str, author: str, since_date: str,
+                    until_date: Optional[str] = None,
+                    on_page: Optional[Callable[[List[Dict]], None]] = None) -> List[Dict]:
         """
         Get commits by a specific author since the given date
         
@@ -63,6 +336,8 @@ class GitHubLOCAnalyzer:
             repo_name: Repository name
             author: Author username to filter commits
             since_date: ISO format date string (e.g., '2025-01-01T00:00:00Z')
+            until_date: Optional ISO format date string; later commits are excluded
+            on_page: Optional callback given each page's commits as soon as it is read
             
         Returns:
             List of commit objects
@@ -79,36 +354,146 @@ class GitHubLOCAnalyzer:
                 'per_page': per_page,
                 'page': page
             }
+            if until_date:
+                params['until'] = until_date
+            
+            # A 304 Not Modified reply does not count against the rate limit
+            page_url = requests.Request('GET', url, params=params).prepare().url
+            etag, cached_body = self._cached_page(page_url)
+            headers = {'If-None-Match': etag} if etag else None
             
-            print(f"Fetching commits page {page}...")
-            response = self.session.get(url, params=params)
+            logger.info(f"Fetching commits page {page}...")
+            response = self._request('GET', url, params=params, headers=headers)
             
             if response.status_code == 404:
-                print(f"Error: Repository {repo_owner}/{repo_name} not found or not accessible")
+                logger.error(f"Error: Repository {repo_owner}/{repo_name} not found or not accessible")
                 return []
-            elif response.status_code == 403:
+            elif response.status_code in (403, 429):
                 error_msg = "Error: API rate limit exceeded or access forbidden"
-                if not self.token:
+                if not self.tokens:
                     error_msg += "\n💡 Try using a GitHub Personal Access Token with --token parameter"
                     error_msg += "\n   Get one at: https://github.com/settings/tokens"
-                print(error_msg)
+                logger.error(error_msg)
                 return []
-            elif response.status_code != 200:
-                print(f"Error fetching commits: {response.status_code} - {response.text}")
+            elif response.status_code not in (200, 304):
+                logger.error(f"Error fetching commits: {response.status_code} - {response.text}")
                 return []
             
-            page_commits = response.json()
+            if response.status_code == 304:
+                body = cached_body
+            else:
+                body = response.content
+                self._cache_page(page_url, response.headers.get('ETag'), body)
+            page_commits = _json_loads(body)
             if not page_commits:
                 break
-                
-            commits.extend(page_commits)
+            
+            # Keep only the fields analyze_repo_loc reads; the full payload also carries
+            # tree, parents, verification and author/committer objects for every commit
+            page_start = len(commits)
+            commits.extend({
+                'sha': commit['sha'],
+                'commit': {
+                    'message': commit['commit']['message'],
+                    'author': {'date': commit['commit']['author']['date']}
+                }
+            } for commit in page_commits)
+            if on_page:
+                on_page(commits[page_start:])
             page += 1
             
             # GitHub API pagination limit check
             if len(page_commits) < per_page:
                 break
         
-        print(f"Found {len(commits)} commits by {author} since {since_date}")
+        logger.info(f"Found {len(commits)} commits by {author} since {since_date}")
+        return commits
+    
+    def _graphql(self, query: str, variables: Dict) -> Optional[Dict]:
+        """
+        Run a GraphQL query
+        
+        Args:
+            query: GraphQL query document
+            variables: Query variables
+            
+        Returns:
+            The response data, or None if the query failed
+        """
+        response = self._request('POST', self.graphql_url, json={'query': query, 'variables': variables})
+        
+        if response.status_code != 200:
+            logger.warning(f"Warning: GraphQL query failed: {response.status_code}")
+            return None
+        
+        body = _json_loads(response.content)
+        if body.get('errors') or not body.get('data'):
+            errors = body.get('errors') or [{}]
+            logger.warning(f"Warning: GraphQL query failed: {errors[0].get('message', 'no data returned')}")
+            return None
+        
+        return body['data']
+    
+    def get_commits_with_stats(self, repo_owner: str, repo_name: str, author: str, since_date: str,
+                               until_date: Optional[str] = None) -> Optional[List[Dict]]:
+        """
+        Get commits by a specific author since the given date, with their stats, via GraphQL
+        
+        One query returns 100 commits including additions/deletions, replacing
+        get_commits plus one get_commit_stats request per commit. Requires a token.
+        
+        Args:
+            repo_owner: Repository owner username
+            repo_name: Repository name
+            author: Author username to filter commits
+            since_date: ISO format date string (e.g., '2025-01-01T00:00:00Z')
+            until_date: Optional ISO format date string; later commits are excluded
+            
+        Returns:
+            List of commit objects in the REST shape with an added 'stats' entry,
+            or None if GraphQL is unavailable and the REST endpoints should be used
+        """
+        user = self._graphql(USER_ID_QUERY, {'login': author})
+        if not user or not user['user']:
+            return None
+        
+        variables = {
+            'owner': repo_owner,
+            'name': repo_name,
+            'authorId': user['user']['id'],
+            'since': since_date,
+            'until': until_date,
+            'after': None
+        }
+        commits = []
+        page = 1
+        
+        while True:
+            logger.info(f"Fetching commits with stats page {page} (GraphQL)...")
+            data = self._graphql(COMMIT_HISTORY_QUERY, variables)
+            if not data or not data['repository'] or not data['repository']['defaultBranchRef']:
+                return None
+            
+            history = data['repository']['defaultBranchRef']['target']['history']
+            for node in history['nodes']:
+                commits.append({
+                    'sha': node['oid'],
+                    'commit': {
+                        'message': node['message'],
+                        'author': {'date': node['authoredDate']}
+                    },
+                    'stats': {
+                        'additions': node['additions'],
+                        'deletions': node['deletions']
+                    }
+                })
+            
+            if not history['pageInfo']['hasNextPage']:
+                break
+            variables['after'] = history['pageInfo']['endCursor']
+            page += 1
+        
+        logger.info(f"Found {len(commits)} commits by {author} since {since_date}")
         return commits
     
     def get_commit_stats(self, repo_owner: str, repo_name: str, commit_sha: str) -> Tuple[int, int]:
@@ -123,23 +508,38 @@ class GitHubLOCAnalyzer:
         Returns:
             Tuple of (additions, deletions)
         """
-        url = f"{self.base_url}/repos/{repo_owner}/{repo_name}/commits/{commit_sha}"
+        if self._cache is not None:
+            with self._cache_lock:
+                cached = self._cache.execute(
+                    "SELECT additions, deletions FROM commit_stats WHERE sha = ?", (commit_sha,)
+                ).fetchone()
+            if cached:
+                return cached
         
-        response = self.session.get(url)
+        url = f"{self.base_url}/repos/{repo_owner}/{repo_name}/commits/{commit_sha}"
+        response = self._request('GET', url)
         
         if response.status_code != 200:
-            print(f"Warning: Could not fetch stats for commit {commit_sha}: {response.status_code}")
+            logger.warning(f"Warning: Could not fetch stats for commit {commit_sha}: {response.status_code}")
             return 0, 0
         
-        commit_data = response.json()
+        commit_data = _json_loads(response.content)
         stats = commit_data.get('stats', {})
         
         additions = stats.get('additions', 0)
         deletions = stats.get('deletions', 0)
         
+        if self._cache is not None:
+            with self._cache_lock:
+                self._cache.execute(
+                    "INSERT OR REPLACE INTO commit_stats (sha, additions, deletions) VALUES (?, ?, ?)",
+                    (commit_sha, additions, deletions)
+                )
+        
         return additions, deletions
     
-    def analyze_repo_loc(self, repo_owner: str, repo_name: str, author: str, start_date: str = "2025-01-01") -> Dict:
+    def analyze_repo_loc(self, repo_owner: str, repo_name: str, author: str, start_date: str = "2025-01-01",
+                         end_date: Optional[str] = None) -> Dict:
         """
         Analyze LOC statistics for a repository
         
@@ -148,6 +548,7 @@ class GitHubLOCAnalyzer:
             repo_name: Repository name
             author: Author username to analyze
             start_date: Start date in YYYY-MM-DD format
+            end_date: Optional end date in YYYY-MM-DD format (inclusive)
             
         Returns:
             Dictionary containing LOC statistics
@@ -158,62 +559,102 @@ class GitHubLOCAnalyzer:
             start_datetime = start_datetime.replace(tzinfo=timezone.utc)
             since_date = start_datetime.isoformat()
         except ValueError:
-            print(f"Error: Invalid date format '{start_date}'. Please use YYYY-MM-DD format.")
+            logger.error(f"Error: Invalid date format '{start_date}'. Please use YYYY-MM-DD format.")
             return {}
         
-        print(f"\nAnalyzing LOC for repository: {repo_owner}/{repo_name}")
-        print(f"Author: {author}")
-        print(f"Start date: {start_date}")
-        print("-" * 50)
-        
-        # Get commits
-        commits = self.get_commits(repo_owner, repo_name, author, since_date)
-        
-        if not commits:
-            return {
-                'repository': f"{repo_owner}/{repo_name}",
-                'author': author,
-                'start_date': start_date,
-                'total_commits': 0,
-                'total_additions': 0,
-                'total_deletions': 0,
-                'total_changes': 0,
-                'commits': []
-            }
-        
-        total_additions = 0
-        total_deletions = 0
-        commit_details = []
+        until_date = None
+        if end_date:
+            try:
+                end_datetime = datetime.strptime(end_date, "%Y-%m-%d")
+                end_datetime = end_datetime.replace(hour=23, minute=59, second=59, tzinfo=timezone.utc)
+                until_date = end_datetime.isoformat()
+            except ValueError:
+                logger.error(f"Error: Invalid date format '{end_date}'. Please use YYYY-MM-DD format.")
+                return {}
         
-        print(f"\nFetching detailed statistics for {len(commits)} commits...")
+        logger.info(f"\nAnalyzing LOC for repository: {repo_owner}/{repo_name}")
+        logger.info(f"Author: {author}")
+        logger.info(f"Start date: {start_date}")
+        if end_date:
+            logger.info(f"End date: {end_date}")
+        logger.info("-" * 50)
         
-        for i, commit in enumerate(commits, 1):
-            commit_sha = commit['sha']
-            commit_message = commit['commit']['message'].split('\n')[0]  # First line only
-            commit_date = commit['commit']['author']['date']
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            stats_futures = []
             
-            print(f"Processing commit {i}/{len(commits)}: {commit_sha[:8]}...")
+            def prefetch_stats(page_commits: List[Dict]):
+                # Start fetching a page's stats while the next page is being listed
+                stats_futures.extend(
+                    executor.submit(self.get_commit_stats, repo_owner, repo_name, commit['sha'])
+                    for commit in page_commits
+                )
             
-            additions, deletions = self.get_commit_stats(repo_owner, repo_name, commit_sha)
+            # Get commits, with their stats in the same request when GraphQL is available
+            commits = None
+            if self.tokens:
+                commits = self.get_commits_with_stats(repo_owner, repo_name, author, since_date, until_date)
+            if commits is None:
+                commits = self.get_commits(repo_owner, repo_name, author, since_date, until_date,
+                                           on_page=prefetch_stats)
             
-            total_additions += additions
-            total_deletions += deletions
+            if not commits:
+                executor.shutdown(cancel_futures=True)
+                return {
+                    'repository': f"{repo_owner}/{repo_name}",
+                    'author': author,
+                    'start_date': start_date,
+                    'end_date': end_date,
+                    'total_commits': 0,
+                    'total_additions': 0,
+                    'total_deletions': 0,
+                    'total_changes': 0,
+                    'commits': []
+                }
             
-            commit_details.append({
-                'sha': commit_sha,
-                'message': commit_message,
-                'date': commit_date,
-                'additions': additions,
-                'deletions': deletions,
-                'total_changes': additions + deletions
-            })
+            # Per-commit columns, filled in commit order; the totals are then plain sums over ints
+            commit_count = len(commits)
+            additions_by_commit = [0] * commit_count
+            deletions_by_commit = [0] * commit_count
+            
+            if not stats_futures:
+                # GraphQL listing: the stats are already on each commit
+                for i, commit in enumerate(commits):
+                    additions_by_commit[i] = commit['stats']['additions']
+                    deletions_by_commit[i] = commit['stats']['deletions']
+            else:
+                future_index = {future: i for i, future in enumerate(stats_futures)}
+                
+                logger.info(f"\nFetching detailed statistics for {commit_count} commits...")
+                
+                for done, future in enumerate(as_completed(stats_futures), 1):
+                    i = future_index[future]
+                    additions_by_commit[i], deletions_by_commit[i] = future.result()
+                    
+                    logger.debug("Processed commit %d/%d: %s...", done, commit_count, commits[i]['sha'][:8])
+                    if done % PROGRESS_INTERVAL == 0 or done == commit_count:
+                        logger.info(f"Processed {done}/{commit_count} commits...")
         
+        total_additions = sum(additions_by_commit)
+        total_deletions = sum(deletions_by_commit)
         total_changes = total_additions + total_deletions
         
+        commit_details = [
+            CommitStat(
+                sha=commit['sha'],
+                message=commit['commit']['message'].partition('\n')[0],
+                date=commit['commit']['author']['date'],
+                additions=additions,
+                deletions=deletions,
+                total_changes=additions + deletions
+            )
+            for commit, additions, deletions in zip(commits, additions_by_commit, deletions_by_commit)
+        ]
+        
         results = {
             'repository': f"{repo_owner}/{repo_name}",
             'author': author,
             'start_date': start_date,
+            'end_date': end_date,
             'total_commits': len(commits),
             'total_additions': total_additions,
             'total_deletions': total_deletions,
@@ -234,7 +675,7 @@ class GitHubLOCAnalyzer:
         print("=" * 60)
         print(f"Repository: {results['repository']}")
         print(f"Author: {results['author']}")
-        print(f"Analysis period: From {results['start_date']} to present")
+        print(f"Analysis period: From {results['start_date']} to {results.get('end_date') or 'present'}")
         print(f"Total commits: {results['total_commits']}")
         print("-" * 60)
         print(f"Total additions: {results['total_additions']:,} lines")
@@ -247,10 +688,33 @@ class GitHubLOCAnalyzer:
             print(f"Average changes per commit: {avg_changes:.1f} lines")
         
         print("\nTop 10 commits by changes:")
-        sorted_commits = sorted(results['commits'], key=lambda x: x['total_changes'], reverse=True)
+        top_commits = heapq.nlargest(10, results['commits'], key=lambda x: x.total_changes)
         
-        for i, commit in enumerate(sorted_commits[:10], 1):
-            print(f"{i:2d}. {commit['sha'][:8]} ({commit['total_changes']:4d} changes) - {commit['message'][:50]}...")
+        for i, commit in enumerate(top_commits, 1):
+            print(f"{i:2d}. {commit.sha[:8]} ({commit.total_changes:4d} changes) - {commit.message[:50]}...")
+
+
+def _start_logging(verbose: bool = False) -> QueueListener:
+    """
+    Route progress logging through a queue to a background thread
+    
+    Worker threads only enqueue records, so they never block on a slow or
+    piped stdout.
+    
+    Args:
+        verbose: Also log every processed commit
+    
+    Returns:
+        The running listener; stop it to flush pending messages
+    """
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    log_queue = queue.Queue(-1)
+    logger.addHandler(QueueHandler(log_queue))
+    logger.setLevel(logging.DEBUG if verbose else logging.INFO)
+    listener = QueueListener(log_queue, handler)
+    listener.start()
+    return listener
 
 
 def main():
@@ -265,6 +729,8 @@ GitHub Personal Access Token Required:
   Usage options:
   1. Command line: --token YOUR_TOKEN_HERE
   2. Environment: export GITHUB_TOKEN=YOUR_TOKEN_HERE
+  3. Several tokens, used in rotation: --token TOKEN_A --token TOKEN_B
+     or export GITHUB_TOKENS=TOKEN_A,TOKEN_B
   
   Without a token, you're limited to 60 requests/hour.''',
         formatter_class=argparse.RawDescriptionHelpFormatter
@@ -274,34 +740,59 @@ GitHub Personal Access Token Required:
     parser.add_argument('author', help='Author username to analyze')
     parser.add_argument('--start-date', default='2025-01-01', 
                       help='Start date in YYYY-MM-DD format (default: 2025-01-01)')
-    parser.add_argument('--token', 
-                      help='GitHub Personal Access Token (or set GITHUB_TOKEN env var)')
+    parser.add_argument('--end-date',
+                      help='End date in YYYY-MM-DD format, inclusive (default: present)')
+    parser.add_argument('--token', action='append',
+                      help='GitHub Personal Access Token (or set GITHUB_TOKEN env var); '
+                           'repeat to rotate through several tokens')
     parser.add_argument('--output', help='Output file path to save results as JSON')
+    parser.add_argument('--workers', type=int, default=DEFAULT_MAX_WORKERS,
+                      help=f'Number of commits to fetch stats for concurrently (default: {DEFAULT_MAX_WORKERS})')
+    parser.add_argument('--cache-file', default=DEFAULT_CACHE_PATH,
+                      help=f'SQLite cache of commit stats reused across runs; used only when commits are '
+                           f'fetched through the REST API (default: {DEFAULT_CACHE_PATH})')
+    parser.add_argument('--no-cache', action='store_true',
+                      help='Disable the commit stats cache')
+    parser.add_argument('--verbose', action='store_true',
+                      help='Report every processed commit instead of every 50')
     
     args = parser.parse_args()
     
-    # Get token from args or environment
-    token = args.token or os.getenv('GITHUB_TOKEN')
+    # Get tokens from args or environment
+    tokens = args.token or [t.strip() for t in os.getenv('GITHUB_TOKENS', '').split(',') if t.strip()]
+    if not tokens and os.getenv('GITHUB_TOKEN'):
+        tokens = [os.getenv('GITHUB_TOKEN')]
     
     # Initialize analyzer
-    analyzer = GitHubLOCAnalyzer(token=token)
-    
-    # Analyze repository
-    results = analyzer.analyze_repo_loc(
-        repo_owner=args.repo_owner,
-        repo_name=args.repo_name,
-        author=args.author,
-        start_date=args.start_date
+    analyzer = GitHubLOCAnalyzer(
+        token=tokens,
+        max_workers=args.workers,
+        cache_path=None if args.no_cache else args.cache_file
     )
     
+    # Analyze repository; progress is logged from a background thread
+    listener = _start_logging(verbose=args.verbose)
+    try:
+        results = analyzer.analyze_repo_loc(
+            repo_owner=args.repo_owner,
+            repo_name=args.repo_name,
+            author=args.author,
+            start_date=args.start_date,
+            end_date=args.end_date
+        )
+    finally:
+        analyzer.close()
+        # Flush pending progress messages before the summary is printed
+        listener.stop()
+    
     if results:
         # Print summary
         analyzer.print_summary(results)
         
         # Save to file if specified
         if args.output:
-            with open(args.output, 'w') as f:
-                json.dump(results, f, indent=2, default=str)
+            with open(args.output, 'w', encoding='utf-8') as f:
+                f.write(_json_dumps(results))
             print(f"\nDetailed results saved to: {args.output}")
     else:
         print("Analysis failed or returned no results.")
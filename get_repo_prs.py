@@ -20,41 +20,279 @@ Without a PAT, you'll be limited to 60 API requests per hour and may not access
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 from datetime import datetime, timezone
 import argparse
 import sys
+import time
 import os
-from typing import Dict, List, Optional
+import itertools
+import logging
+import queue
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, is_dataclass
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+try:
+    import orjson  # Optional: much faster JSON parsing/serialization
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Number of PR details fetched concurrently with --detailed
+DEFAULT_MAX_WORKERS = 8
+
+# Pooled keep-alive connections to api.github.com
+POOL_MAXSIZE = 50
+
+# Rate-limited requests are tried this many times; longer waits give up rather than stall the run
+MAX_RETRIES = 5
+MAX_RETRY_WAIT = 300
+
+# A token is set aside until its rate limit resets once fewer requests than this remain
+RATE_LIMIT_THRESHOLD = 10
+
+# The search API returns at most this many results per query
+SEARCH_RESULT_LIMIT = 1000
+
+# Search qualifiers matching the REST 'state' parameter
+STATE_QUALIFIERS = {'open': ' is:open', 'closed': ' is:closed', 'all': ''}
+
+# Pull requests with their statistics, 100 per page
+PULL_REQUESTS_QUERY = """
+query($q: String!, $after: String) {
+  search(query: $q, type: ISSUE, first: 100, after: $after) {
+    issueCount
+    pageInfo { endCursor hasNextPage }
+    nodes {
+      ... on PullRequest {
+        number title state isDraft createdAt updatedAt closedAt mergedAt url
+        additions deletions changedFiles baseRefName headRefName
+        commits { totalCount }
+        comments { totalCount }
+        reviews(first: 100) { nodes { comments { totalCount } } }
+        labels(first: 100) { nodes { name } }
+      }
+    }
+  }
+}
+"""
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse a JSON response body, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> str:
+    """Serialize results as indented JSON, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2, default=_json_default)
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize PRInfo records; anything else unknown becomes a string"""
+    if is_dataclass(obj):
+        return asdict(obj)
+    return str(obj)
+
+
+@dataclass(slots=True)
+class PRInfo:
+    """A pull request and its statistics"""
+    number: int
+    title: str
+    state: str  # open, closed
+    draft: bool
+    created_at: str
+    updated_at: str
+    closed_at: Optional[str]
+    merged_at: Optional[str]
+    html_url: str
+    additions: Optional[int]  # None when only the REST list endpoint was used
+    deletions: Optional[int]
+    changed_files: Optional[int]
+    commits: Optional[int]
+    comments: Optional[int]
+    review_comments: Optional[int]
+    labels: List[str]
+    base_branch: str
+    head_branch: str
 
 
 class GitHubPRAnalyzer:
     """GitHub repository Pull Request analyzer"""
     
-    def __init__(self, token: Optional[str] = None):
+    def __init__(self, token: Union[str, List[str], None] = None, max_workers: int = DEFAULT_MAX_WORKERS):
         """
         Initialize the GitHub PR analyzer
         
         Args:
-            token: GitHub personal access token (required for reliable operation)
+            token: GitHub personal access token (required for reliable operation), or a
+                list of tokens to rotate through to get a rate limit per token
+            max_workers: Number of PR details to fetch concurrently
         """
-        self.token = token
+        self.tokens: List[str] = [token] if isinstance(token, str) else list(token or [])
+        # Requests rotate through the tokens; None stands for unauthenticated access
+        self._token_pool: List[Optional[str]] = self.tokens or [None]
+        self._token_cycle = itertools.cycle(self._token_pool)
+        # (token, resource) -> time that rate limit resets; core and graphql are separate budgets
+        self._token_reset: Dict[Tuple[Optional[str], str], float] = {}
+        self._token_lock = threading.Lock()
+        self.max_workers = max_workers
         self.base_url = "https://api.github.com"
+        self.graphql_url = "https://api.github.com/graphql"
         self.session = requests.Session()
         
-        if not self.token:
+        # Reuse warm TLS connections across requests and retry transient server errors.
+        # GraphQL queries are read-only, so their POSTs are as safe to retry as GETs.
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=max(POOL_MAXSIZE, max_workers),
+            max_retries=Retry(
+                total=5,
+                backoff_factor=1.0,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {'POST'},
+                respect_retry_after_header=True,
+                raise_on_status=False
+            )
+        )
+        self.session.mount("https://", adapter)
+        
+        if not self.tokens:
             print("⚠️  WARNING: No GitHub Personal Access Token provided!")
             print("   You'll be limited to 60 requests/hour and cannot access private repos.")
             print("   Get a PAT at: https://github.com/settings/tokens")
             print("   Use --token parameter or set GITHUB_TOKEN environment variable\n")
         
-        if self.token:
+        if self.tokens:
             self.session.headers.update({
-                'Authorization': f'token {self.token}',
                 'Accept': 'application/vnd.github.v3+json'
             })
     
-    def get_pull_requests(self, repo_owner: str, repo_name: str, author: str, since_date: str, state: str = "all") -> List[Dict]:
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send a GitHub API request, waiting out rate limits
+        
+        Each request uses the next token in rotation, skipping tokens whose rate
+        limit is exhausted. Responses rejected by the primary or secondary rate
+        limit (403/429) are retried with another token or after the delay GitHub
+        asks for, backing off on each attempt. Any other response is returned
+        for the caller to handle.
+        
+        Args:
+            method: HTTP method
+            url: Request URL
+            **kwargs: Passed through to requests.Session.request
+            
+        Returns:
+            The final response
+        """
+        headers = kwargs.pop('headers', None) or {}
+        resource = self._rate_limit_resource(url)
+        
+        for attempt in range(1, MAX_RETRIES + 1):
+            token = self._next_token(resource)
+            request_headers = dict(headers)
+            if token:
+                request_headers['Authorization'] = f'token {token}'
+            
+            response = self.session.request(method, url, headers=request_headers, **kwargs)
+            self._track_rate_limit(token, resource, response)
+            if response.status_code not in (403, 429) or attempt == MAX_RETRIES:
+                break
+            
+            wait = self._rate_limit_wait(response, attempt, resource)
+            if wait is None:
+                break
+            logger.warning(f"Rate limited ({response.status_code}), retrying in {wait:.0f}s (attempt {attempt}/{MAX_RETRIES})...")
+            time.sleep(wait)
+        
+        self._throttle(resource)
+        return response
+    
+    def _rate_limit_resource(self, url: str) -> str:
+        """Name of the rate limit budget a request URL draws from, as in X-RateLimit-Resource"""
+        return 'graphql' if url.startswith(self.graphql_url) else 'core'
+    
+    def _next_token(self, resource: str) -> Optional[str]:
+        """Pick the next token in rotation, skipping tokens whose rate limit for the resource is exhausted"""
+        with self._token_lock:
+            now = time.time()
+            for _ in range(len(self._token_pool)):
+                token = next(self._token_cycle)
+                if self._token_reset.get((token, resource), 0) <= now:
+                    return token
+            # Every token is exhausted; use the one that resets first
+            return min(self._token_pool, key=lambda t: self._token_reset[(t, resource)])
+    
+    def _track_rate_limit(self, token: Optional[str], resource: str, response: requests.Response):
+        """Mark a token's resource as exhausted until its reset time when only a few requests remain"""
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        reset = response.headers.get('X-RateLimit-Reset')
+        if remaining is None or reset is None:
+            return
+        limit = int(response.headers.get('X-RateLimit-Limit', RATE_LIMIT_THRESHOLD * 10))
+        if int(remaining) >= min(RATE_LIMIT_THRESHOLD, limit // 10):
+            return
+        resource = response.headers.get('X-RateLimit-Resource', resource)
+        with self._token_lock:
+            self._token_reset[(token, resource)] = float(reset)
+    
+    def _seconds_until_token_available(self, resource: str) -> float:
+        """Seconds until some token has rate limit left for the resource (0 if one has now)"""
+        with self._token_lock:
+            reset = min(self._token_reset.get((t, resource), 0) for t in self._token_pool)
+        now = time.time()
+        return reset - now + 1 if reset > now else 0
+    
+    def _rate_limit_wait(self, response: requests.Response, attempt: int, resource: str) -> Optional[float]:
+        """
+        Work out how long to wait before retrying a 403/429 response
+        
+        Args:
+            response: The rejected response
+            attempt: Attempt number, starting at 1
+            resource: Rate limit budget the request draws from
+            
+        Returns:
+            Seconds to wait, or None if the response is not retryable or the
+            wait is longer than MAX_RETRY_WAIT
+        """
+        retry_after = response.headers.get('Retry-After')
+        if retry_after:
+            # Secondary rate limit
+            wait = float(retry_after) * attempt
+        elif response.headers.get('X-RateLimit-Remaining') == '0':
+            # Primary rate limit: retry right away with another token, or wait for a reset
+            wait = self._seconds_until_token_available(resource)
+        elif response.status_code == 429 or 'rate limit' in response.text.lower():
+            wait = 2 ** attempt
+        else:
+            # Plain access denied
+            return None
+        
+        return wait if wait <= MAX_RETRY_WAIT else None
+    
+    def _throttle(self, resource: str):
+        """Pause until a rate limit resets when every token is nearly exhausted for the resource"""
+        wait = self._seconds_until_token_available(resource)
+        if 0 < wait <= MAX_RETRY_WAIT:
+            logger.warning(f"API rate limit nearly exhausted, waiting {wait:.0f}s for it to reset...")
+            time.sleep(wait)
+    
+    def get_pull_requests(self, repo_owner: str, repo_name: str, author: str, since_date: str, state: str = "all",
+                          on_page: Optional[Callable[[List[Dict]], None]] = None) -> List[Dict]:
         """
         Get pull requests by a specific author since the given date
         
@@ -64,6 +302,7 @@ class GitHubPRAnalyzer:
             author: Author username to filter PRs
             since_date: ISO format date string (e.g., '2025-01-01T00:00:00Z')
             state: PR state filter ('open', 'closed', 'all')
+            on_page: Optional callback given each page's matching PRs as soon as it is read
             
         Returns:
             List of pull request objects
@@ -71,6 +310,10 @@ class GitHubPRAnalyzer:
         pull_requests = []
         page = 1
         per_page = 100
+        author_login = author.lower()
+        # GitHub timestamps are UTC ISO 8601 ('2025-01-01T00:00:00Z'), so they compare as strings
+        since_datetime = datetime.fromisoformat(since_date.replace('Z', '+00:00'))
+        since_iso = since_datetime.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
         
         while True:
             url = f"{self.base_url}/repos/{repo_owner}/{repo_name}/pulls"
@@ -82,50 +325,157 @@ class GitHubPRAnalyzer:
                 'direction': 'desc'
             }
             
-            print(f"Fetching PRs page {page}...")
-            response = self.session.get(url, params=params)
+            logger.info(f"Fetching PRs page {page}...")
+            response = self._request('GET', url, params=params)
             
             if response.status_code == 404:
-                print(f"Error: Repository {repo_owner}/{repo_name} not found or not accessible")
+                logger.error(f"Error: Repository {repo_owner}/{repo_name} not found or not accessible")
                 return []
-            elif response.status_code == 403:
+            elif response.status_code in (403, 429):
                 error_msg = "Error: API rate limit exceeded or access forbidden"
-                if not self.token:
+                if not self.tokens:
                     error_msg += "\n💡 Try using a GitHub Personal Access Token with --token parameter"
                     error_msg += "\n   Get one at: https://github.com/settings/tokens"
-                print(error_msg)
+                logger.error(error_msg)
                 return []
             elif response.status_code != 200:
-                print(f"Error fetching PRs: {response.status_code} - {response.text}")
+                logger.error(f"Error fetching PRs: {response.status_code} - {response.text}")
                 return []
             
-            page_prs = response.json()
+            page_prs = _json_loads(response.content)
             if not page_prs:
                 break
             
             # Filter PRs by author and date
-            filtered_prs = []
+            page_start = len(pull_requests)
+            reached_since = False
             for pr in page_prs:
+                # Since PRs are sorted by creation date (desc), we can stop at the first older one
+                if pr['created_at'] < since_iso:
+                    reached_since = True
+                    break
+                
                 # Check if PR is by the specified author
-                if pr['user']['login'].lower() == author.lower():
-                    # Check if PR was created after the specified date
-                    created_at = datetime.fromisoformat(pr['created_at'].replace('Z', '+00:00'))
-                    since_datetime = datetime.fromisoformat(since_date.replace('Z', '+00:00'))
-                    
-                    if created_at >= since_datetime:
-                        filtered_prs.append(pr)
-                    else:
-                        # Since PRs are sorted by creation date (desc), we can stop here
-                        return pull_requests
+                if pr['user']['login'].lower() == author_login:
+                    # Keep only the fields analyze_repo_prs reads; the full payload also
+                    # carries user, repo and link objects for every PR
+                    pull_requests.append({
+                        'number': pr['number'],
+                        'title': pr['title'],
+                        'state': pr['state'],
+                        'draft': pr.get('draft', False),
+                        'created_at': pr['created_at'],
+                        'updated_at': pr['updated_at'],
+                        'closed_at': pr.get('closed_at'),
+                        'merged_at': pr.get('merged_at'),
+                        'html_url': pr['html_url'],
+                        'labels': [{'name': label['name']} for label in pr.get('labels', [])],
+                        'base': {'ref': pr['base']['ref']},
+                        'head': {'ref': pr['head']['ref']}
+                    })
             
-            pull_requests.extend(filtered_prs)
+            if on_page and len(pull_requests) > page_start:
+                on_page(pull_requests[page_start:])
+            
+            if reached_since:
+                break
             page += 1
             
             # GitHub API pagination limit check
             if len(page_prs) < per_page:
                 break
         
-        print(f"Found {len(pull_requests)} PRs by {author} since {since_date}")
+        logger.info(f"Found {len(pull_requests)} PRs by {author} since {since_date}")
+        return pull_requests
+    
+    def _graphql(self, query: str, variables: Dict) -> Optional[Dict]:
+        """
+        Run a GraphQL query
+        
+        Args:
+            query: GraphQL query document
+            variables: Query variables
+            
+        Returns:
+            The response data, or None if the query failed
+        """
+        response = self._request('POST', self.graphql_url, json={'query': query, 'variables': variables})
+        
+        if response.status_code != 200:
+            logger.warning(f"Warning: GraphQL query failed: {response.status_code}")
+            return None
+        
+        body = _json_loads(response.content)
+        if body.get('errors') or not body.get('data'):
+            errors = body.get('errors') or [{}]
+            logger.warning(f"Warning: GraphQL query failed: {errors[0].get('message', 'no data returned')}")
+            return None
+        
+        return body['data']
+    
+    def get_pull_requests_with_stats(self, repo_owner: str, repo_name: str, author: str, since_date: str, state: str = "all") -> Optional[List[Dict]]:
+        """
+        Get pull requests by a specific author since the given date, with their statistics, via GraphQL
+        
+        One search query returns 100 PRs including additions, deletions, commit and
+        comment counts, which the REST list endpoint does not provide. Requires a token.
+        
+        Args:
+            repo_owner: Repository owner username
+            repo_name: Repository name
+            author: Author username to filter PRs
+            since_date: ISO format date string (e.g., '2025-01-01T00:00:00Z')
+            state: PR state filter ('open', 'closed', 'all')
+            
+        Returns:
+            List of pull request objects in the REST shape, or None if GraphQL is
+            unavailable and the REST endpoints should be used
+        """
+        query = (f"repo:{repo_owner}/{repo_name} is:pr author:{author} "
+                 f"created:>={since_date[:10]} sort:created-desc{STATE_QUALIFIERS[state]}")
+        variables = {'q': query, 'after': None}
+        pull_requests = []
+        page = 1
+        
+        while True:
+            logger.info(f"Fetching PRs with stats page {page} (GraphQL)...")
+            data = self._graphql(PULL_REQUESTS_QUERY, variables)
+            if not data:
+                return None
+            
+            search = data['search']
+            if search['issueCount'] > SEARCH_RESULT_LIMIT:
+                logger.warning(f"Warning: {search['issueCount']} PRs exceed the search limit of {SEARCH_RESULT_LIMIT}")
+                return None
+            
+            for node in search['nodes']:
+                pull_requests.append({
+                    'number': node['number'],
+                    'title': node['title'],
+                    'state': 'open' if node['state'] == 'OPEN' else 'closed',
+                    'draft': node['isDraft'],
+                    'created_at': node['createdAt'],
+                    'updated_at': node['updatedAt'],
+                    'closed_at': node['closedAt'],
+                    'merged_at': node['mergedAt'],
+                    'html_url': node['url'],
+                    'additions': node['additions'],
+                    'deletions': node['deletions'],
+                    'changed_files': node['changedFiles'],
+                    'commits': node['commits']['totalCount'],
+                    'comments': node['comments']['totalCount'],
+                    'review_comments': sum(review['comments']['totalCount'] for review in node['reviews']['nodes']),
+                    'labels': node['labels']['nodes'],
+                    'base': {'ref': node['baseRefName']},
+                    'head': {'ref': node['headRefName']}
+                })
+            
+            if not search['pageInfo']['hasNextPage']:
+                break
+            variables['after'] = search['pageInfo']['endCursor']
+            page += 1
+        
+        logger.info(f"Found {len(pull_requests)} PRs by {author} since {since_date}")
         return pull_requests
     
     def get_pr_details(self, repo_owner: str, repo_name: str, pr_number: int) -> Dict:
@@ -141,16 +491,15 @@ class GitHubPRAnalyzer:
             Dictionary containing PR details
         """
         url = f"{self.base_url}/repos/{repo_owner}/{repo_name}/pulls/{pr_number}"
-        
-        response = self.session.get(url)
+        response = self._request('GET', url)
         
         if response.status_code != 200:
-            print(f"Warning: Could not fetch details for PR #{pr_number}: {response.status_code}")
+            logger.warning(f"Warning: Could not fetch details for PR #{pr_number}: {response.status_code}")
             return {}
         
-        return response.json()
+        return _json_loads(response.content)
     
-    def analyze_repo_prs(self, repo_owner: str, repo_name: str, author: str, start_date: str = "2025-01-01", state: str = "all") -> Dict:
+    def analyze_repo_prs(self, repo_owner: str, repo_name: str, author: str, start_date: str = "2025-01-01", state: str = "all", detailed: bool = False) -> Dict:
         """
         Analyze Pull Requests for a repository
         
@@ -160,6 +509,7 @@ class GitHubPRAnalyzer:
             author: Author username to analyze
             start_date: Start date in YYYY-MM-DD format
             state: PR state filter ('open', 'closed', 'all')
+            detailed: Fetch each PR's statistics individually when GraphQL is unavailable
             
         Returns:
             Dictionary containing PR statistics
@@ -170,17 +520,40 @@ class GitHubPRAnalyzer:
             start_datetime = start_datetime.replace(tzinfo=timezone.utc)
             since_date = start_datetime.isoformat()
         except ValueError:
-            print(f"Error: Invalid date format '{start_date}'. Please use YYYY-MM-DD format.")
+            logger.error(f"Error: Invalid date format '{start_date}'. Please use YYYY-MM-DD format.")
             return {}
         
-        print(f"\nAnalyzing Pull Requests for repository: {repo_owner}/{repo_name}")
-        print(f"Author: {author}")
-        print(f"Start date: {start_date}")
-        print(f"State filter: {state}")
-        print("-" * 50)
+        logger.info(f"\nAnalyzing Pull Requests for repository: {repo_owner}/{repo_name}")
+        logger.info(f"Author: {author}")
+        logger.info(f"Start date: {start_date}")
+        logger.info(f"State filter: {state}")
+        logger.info("-" * 50)
         
-        # Get pull requests
-        prs = self.get_pull_requests(repo_owner, repo_name, author, since_date, state)
+        # Get pull requests, with their statistics in the same request when GraphQL is available
+        prs = None
+        if self.tokens:
+            prs = self.get_pull_requests_with_stats(repo_owner, repo_name, author, since_date, state)
+        if prs is None:
+            # The list endpoint omits additions, deletions and the other counts,
+            # so only pay one extra request per PR for them when asked to
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                detail_futures = []
+                
+                def prefetch_details(page_prs: List[Dict]):
+                    # Start fetching a page's details while the next page is being listed
+                    detail_futures.extend(
+                        executor.submit(self.get_pr_details, repo_owner, repo_name, pr['number'])
+                        for pr in page_prs
+                    )
+                
+                prs = self.get_pull_requests(repo_owner, repo_name, author, since_date, state,
+                                             on_page=prefetch_details if detailed else None)
+                
+                if detailed and prs:
+                    logger.info(f"\nFetching details for {len(prs)} pull requests...")
+                    prs = [future.result() or pr for pr, future in zip(prs, detail_futures)]
+                else:
+                    executor.shutdown(cancel_futures=True)
         
         if not prs:
             return {
@@ -196,54 +569,40 @@ class GitHubPRAnalyzer:
                 'pull_requests': []
             }
         
-        pr_details = []
-        open_count = 0
-        closed_count = 0
-        merged_count = 0
-        draft_count = 0
+        logger.info(f"\nProcessing {len(prs)} pull requests...")
         
-        print(f"\nProcessing {len(prs)} pull requests...")
+        # Count PR states
+        state_counts = Counter(pr['state'] for pr in prs)
+        merged_count = sum(1 for pr in prs if pr['state'] == 'closed' and pr.get('merged_at'))
+        draft_count = sum(1 for pr in prs if pr.get('draft', False))
         
-        for i, pr in enumerate(prs, 1):
-            print(f"Processing PR {i}/{len(prs)}: #{pr['number']}...")
-            
-            # Count PR states
-            if pr['state'] == 'open':
-                open_count += 1
-            elif pr['state'] == 'closed':
-                closed_count += 1
-                if pr.get('merged_at'):
-                    merged_count += 1
-            
-            if pr.get('draft', False):
-                draft_count += 1
-            
-            # Extract PR information
-            pr_info = {
-                'number': pr['number'],
-                'title': pr['title'],
-                'state': pr['state'],
-                'draft': pr.get('draft', False),
-                'created_at': pr['created_at'],
-                'updated_at': pr['updated_at'],
-                'closed_at': pr.get('closed_at'),
-                'merged_at': pr.get('merged_at'),
-                'html_url': pr['html_url'],
-                'additions': pr.get('additions', 0),
-                'deletions': pr.get('deletions', 0),
-                'changed_files': pr.get('changed_files', 0),
-                'commits': pr.get('commits', 0),
-                'comments': pr.get('comments', 0),
-                'review_comments': pr.get('review_comments', 0),
-                'labels': [label['name'] for label in pr.get('labels', [])],
-                'base_branch': pr['base']['ref'],
-                'head_branch': pr['head']['ref']
-            }
-            
-            pr_details.append(pr_info)
+        # Extract PR information
+        pr_details = [
+            PRInfo(
+                number=pr['number'],
+                title=pr['title'],
+                state=pr['state'],
+                draft=pr.get('draft', False),
+                created_at=pr['created_at'],
+                updated_at=pr['updated_at'],
+                closed_at=pr.get('closed_at'),
+                merged_at=pr.get('merged_at'),
+                html_url=pr['html_url'],
+                additions=pr.get('additions'),
+                deletions=pr.get('deletions'),
+                changed_files=pr.get('changed_files'),
+                commits=pr.get('commits'),
+                comments=pr.get('comments'),
+                review_comments=pr.get('review_comments'),
+                labels=[label['name'] for label in pr.get('labels', [])],
+                base_branch=pr['base']['ref'],
+                head_branch=pr['head']['ref']
+            )
+            for pr in prs
+        ]
         
         # Sort PRs by number (descending)
-        pr_details.sort(key=lambda x: x['number'], reverse=True)
+        pr_details.sort(key=lambda x: x.number, reverse=True)
         
         results = {
             'repository': f"{repo_owner}/{repo_name}",
@@ -251,8 +610,8 @@ class GitHubPRAnalyzer:
             'start_date': start_date,
             'state_filter': state,
             'total_prs': len(prs),
-            'open_prs': open_count,
-            'closed_prs': closed_count,
+            'open_prs': state_counts['open'],
+            'closed_prs': state_counts['closed'],
             'merged_prs': merged_count,
             'draft_prs': draft_count,
             'pull_requests': pr_details
@@ -286,7 +645,7 @@ class GitHubPRAnalyzer:
             print(f"Merge rate: {merge_rate:.1f}%")
         
         print(f"\nPR Numbers (most recent first):")
-        pr_numbers = [str(pr['number']) for pr in results['pull_requests']]
+        pr_numbers = [str(pr.number) for pr in results['pull_requests']]
         
         # Print PR numbers in chunks of 10 for readability
         for i in range(0, len(pr_numbers), 10):
@@ -295,10 +654,30 @@ class GitHubPRAnalyzer:
         
         print(f"\nRecent PRs Details:")
         for i, pr in enumerate(results['pull_requests'][:10], 1):
-            status_emoji = "🟢" if pr['state'] == 'open' else "🔴" if pr['state'] == 'closed' else "⚪"
-            merged_text = " (merged)" if pr['merged_at'] else ""
-            draft_text = " [DRAFT]" if pr['draft'] else ""
-            print(f"{i:2d}. {status_emoji} #{pr['number']}{draft_text} - {pr['title'][:50]}...{merged_text}")
+            status_emoji = "🟢" if pr.state == 'open' else "🔴" if pr.state == 'closed' else "⚪"
+            merged_text = " (merged)" if pr.merged_at else ""
+            draft_text = " [DRAFT]" if pr.draft else ""
+            print(f"{i:2d}. {status_emoji} #{pr.number}{draft_text} - {pr.title[:50]}...{merged_text}")
+
+
+def _start_logging() -> QueueListener:
+    """
+    Route progress logging through a queue to a background thread
+    
+    Worker threads only enqueue records, so they never block on a slow or
+    piped stdout.
+    
+    Returns:
+        The running listener; stop it to flush pending messages
+    """
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    log_queue = queue.Queue(-1)
+    logger.addHandler(QueueHandler(log_queue))
+    logger.setLevel(logging.INFO)
+    listener = QueueListener(log_queue, handler)
+    listener.start()
+    return listener
 
 
 def main():
@@ -313,6 +692,8 @@ GitHub Personal Access Token Required:
   Usage options:
   1. Command line: --token YOUR_TOKEN_HERE
   2. Environment: export GITHUB_TOKEN=YOUR_TOKEN_HERE
+  3. Several tokens, used in rotation: --token TOKEN_A --token TOKEN_B
+     or export GITHUB_TOKENS=TOKEN_A,TOKEN_B
   
   Without a token, you're limited to 60 requests/hour.''',
         formatter_class=argparse.RawDescriptionHelpFormatter
@@ -324,26 +705,39 @@ GitHub Personal Access Token Required:
                       help='Start date in YYYY-MM-DD format (default: 2025-01-01)')
     parser.add_argument('--state', choices=['open', 'closed', 'all'], default='all',
                       help='Filter PRs by state (default: all)')
-    parser.add_argument('--token', 
-                      help='GitHub Personal Access Token (or set GITHUB_TOKEN env var)')
+    parser.add_argument('--token', action='append',
+                      help='GitHub Personal Access Token (or set GITHUB_TOKEN env var); '
+                           'repeat to rotate through several tokens')
     parser.add_argument('--output', help='Output file path to save results as JSON')
+    parser.add_argument('--detailed', action='store_true',
+                      help='Without a token, fetch additions/deletions and other counts with one extra request per PR')
+    parser.add_argument('--workers', type=int, default=DEFAULT_MAX_WORKERS,
+                      help=f'Number of PR details to fetch concurrently with --detailed (default: {DEFAULT_MAX_WORKERS})')
     
     args = parser.parse_args()
     
-    # Get token from args or environment
-    token = args.token or os.getenv('GITHUB_TOKEN')
+    # Get tokens from args or environment
+    tokens = args.token or [t.strip() for t in os.getenv('GITHUB_TOKENS', '').split(',') if t.strip()]
+    if not tokens and os.getenv('GITHUB_TOKEN'):
+        tokens = [os.getenv('GITHUB_TOKEN')]
     
     # Initialize analyzer
-    analyzer = GitHubPRAnalyzer(token=token)
+    analyzer = GitHubPRAnalyzer(token=tokens, max_workers=args.workers)
     
-    # Analyze repository
-    results = analyzer.analyze_repo_prs(
-        repo_owner=args.repo_owner,
-        repo_name=args.repo_name,
-        author=args.author,
-        start_date=args.start_date,
-        state=args.state
-    )
+    # Analyze repository; progress is logged from a background thread
+    listener = _start_logging()
+    try:
+        results = analyzer.analyze_repo_prs(
+            repo_owner=args.repo_owner,
+            repo_name=args.repo_name,
+            author=args.author,
+            start_date=args.start_date,
+            state=args.state,
+            detailed=args.detailed
+        )
+    finally:
+        # Flush pending progress messages before the summary is printed
+        listener.stop()
     
     if results:
         # Print summary
@@ -351,8 +745,8 @@ GitHub Personal Access Token Required:
         
         # Save to file if specified
         if args.output:
-            with open(args.output, 'w') as f:
-                json.dump(results, f, indent=2, default=str)
+            with open(args.output, 'w', encoding='utf-8') as f:
+                f.write(_json_dumps(results))
             print(f"\nDetailed results saved to: {args.output}")
     else:
         print("Analysis failed or returned no results.")